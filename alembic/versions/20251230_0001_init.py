@@ -23,6 +23,30 @@ def _schema() -> str:
     return os.getenv("DB_SCHEMA", "youtube_subtitles")
 
 
+def _create_index_concurrently(name: str, table: str, columns: list, **kw) -> None:
+    # Must be called inside op.get_context().autocommit_block():
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction.
+    op.create_index(
+        name,
+        table,
+        columns,
+        unique=False,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+        **kw,
+    )
+
+
+def _drop_index_concurrently(name: str, table: str, *, schema: str) -> None:
+    op.drop_index(
+        name,
+        table_name=table,
+        schema=schema,
+        postgresql_concurrently=True,
+        if_exists=True,
+    )
+
+
 def upgrade() -> None:
     schema = _schema()
     op.execute(sa.text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
@@ -51,10 +75,6 @@ def upgrade() -> None:
         sa.UniqueConstraint("video_id", "language", name="uq_video_language"),
         schema=schema,
     )
-    op.create_index("ix_video_id", "subtitle_records", ["video_id"], unique=False, schema=schema)
-    op.create_index("ix_created_at", "subtitle_records", ["created_at"], unique=False, schema=schema)
-    op.create_index("ix_status", "subtitle_records", ["extraction_status"], unique=False, schema=schema)
-
     op.create_table(
         "extraction_jobs",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
@@ -73,23 +93,53 @@ def upgrade() -> None:
         sa.UniqueConstraint("job_id", name="uq_job_id"),
         schema=schema,
     )
-    op.create_index("ix_video_id_job", "extraction_jobs", ["video_id"], unique=False, schema=schema)
-    op.create_index("ix_job_status", "extraction_jobs", ["job_status"], unique=False, schema=schema)
-    op.create_index("ix_created_at_job", "extraction_jobs", ["created_at"], unique=False, schema=schema)
-    # PERFORMANCE: Composite index for pending job queries
-    # Query pattern: WHERE video_id = ? AND language = ? AND job_status IN (?, ?)
-    # This index supports the get_pending_job() query in subtitle_repository.py
-    op.create_index(
-        "ix_pending_jobs_lookup",
-        "extraction_jobs",
-        ["video_id", "language", "job_status"],
-        unique=False,
-        schema=schema,
-    )
+
+    # Build secondary indexes CONCURRENTLY (outside the migration transaction) so
+    # re-running against a live database never blocks writes on these tables.
+    with op.get_context().autocommit_block():
+        _create_index_concurrently("ix_video_id", "subtitle_records", ["video_id"], schema=schema)
+        _create_index_concurrently("ix_created_at", "subtitle_records", ["created_at"], schema=schema)
+        _create_index_concurrently("ix_status", "subtitle_records", ["extraction_status"], schema=schema)
+        # PERFORMANCE: GIN index for JSONB containment (@>) lookups on subtitle payloads.
+        # jsonb_path_ops only supports @> but is roughly half the size of the default jsonb_ops.
+        _create_index_concurrently(
+            "ix_subtitles_jsonb_path",
+            "subtitle_records",
+            ["subtitles"],
+            schema=schema,
+            postgresql_using="gin",
+            postgresql_ops={"subtitles": "jsonb_path_ops"},
+        )
+
+        # Partial index: status lookups target the minority of in-flight/failed
+        # jobs, so completed rows (the bulk of the table) are left out.
+        _create_index_concurrently(
+            "ix_job_status_active",
+            "extraction_jobs",
+            ["job_status"],
+            schema=schema,
+            postgresql_where=sa.text("job_status IN ('queued', 'processing', 'failed')"),
+        )
+        _create_index_concurrently("ix_created_at_job", "extraction_jobs", ["created_at"], schema=schema)
+        # PERFORMANCE: Partial covering index for pending job queries
+        # Query pattern: WHERE video_id = ? AND language = ? AND job_status IN ('queued', 'processing')
+        # This index supports the get_pending_job_id() query in subtitle_repository.py;
+        # finished jobs drop out of the index, keeping it small, and the INCLUDE
+        # columns let the lookup run as an index-only scan.
+        _create_index_concurrently(
+            "ix_pending_jobs_covering",
+            "extraction_jobs",
+            ["video_id", "language"],
+            schema=schema,
+            postgresql_where=sa.text("job_status IN ('queued', 'processing')"),
+            postgresql_include=["job_id", "attempt", "created_at"],
+        )
 
 
 def downgrade() -> None:
     schema = _schema()
-    op.drop_index("ix_pending_jobs_lookup", schema=schema)
+    with op.get_context().autocommit_block():
+        _drop_index_concurrently("ix_subtitles_jsonb_path", "subtitle_records", schema=schema)
+        _drop_index_concurrently("ix_pending_jobs_covering", "extraction_jobs", schema=schema)
     op.drop_table("extraction_jobs", schema=schema)
     op.drop_table("subtitle_records", schema=schema)
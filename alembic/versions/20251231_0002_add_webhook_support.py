@@ -28,65 +28,83 @@ def _schema() -> str:
 def upgrade() -> None:
     schema = _schema()
 
-    # Add webhook columns to extraction_jobs table
-    with op.batch_alter_table("extraction_jobs", schema=schema) as batch_op:
-        batch_op.add_column(
-            sa.Column(
-                "webhook_url",
-                sa.String(length=500),
-                nullable=True,
-                comment="URL to send job completion webhook",
-            )
-        )
-        batch_op.add_column(
-            sa.Column(
-                "webhook_delivered",
-                sa.Boolean(),
-                nullable=True,
-                server_default="false",
-                comment="Whether webhook has been delivered",
-            )
-        )
-        batch_op.add_column(
-            sa.Column(
-                "webhook_delivery_status",
-                sa.String(length=50),
-                nullable=True,
-                comment="Webhook delivery status: pending, delivered, failed",
-            )
-        )
-        batch_op.add_column(
-            sa.Column(
-                "webhook_delivery_error",
-                sa.String(length=500),
-                nullable=True,
-                comment="Error message if webhook delivery failed",
-            )
-        )
-
-    # Create index on webhook_delivery_status for monitoring failed webhooks
-    op.create_index(
-        "ix_webhook_delivery_status",
+    # Add webhook columns to extraction_jobs table.
+    # Plain ADD COLUMN (not batch_alter_table, which is meant for SQLite) so
+    # PostgreSQL only updates the catalog; the constant server_default is
+    # stored as metadata (PG 11+) and no table rewrite happens.
+    op.add_column(
         "extraction_jobs",
-        ["webhook_delivery_status"],
-        unique=False,
+        sa.Column(
+            "webhook_url",
+            sa.String(length=500),
+            nullable=True,
+            comment="URL to send job completion webhook",
+        ),
+        schema=schema,
+    )
+    op.add_column(
+        "extraction_jobs",
+        sa.Column(
+            "webhook_delivered",
+            sa.Boolean(),
+            nullable=True,
+            server_default="false",
+            comment="Whether webhook has been delivered",
+        ),
+        schema=schema,
+    )
+    op.add_column(
+        "extraction_jobs",
+        sa.Column(
+            "webhook_delivery_status",
+            sa.String(length=50),
+            nullable=True,
+            comment="Webhook delivery status: pending, delivered, failed",
+        ),
+        schema=schema,
+    )
+    op.add_column(
+        "extraction_jobs",
+        sa.Column(
+            "webhook_delivery_error",
+            sa.String(length=500),
+            nullable=True,
+            comment="Error message if webhook delivery failed",
+        ),
         schema=schema,
     )
 
+    # Create partial index on webhook_delivery_status for monitoring failed webhooks.
+    # Delivered rows are never looked up by status, so they are excluded.
+    # Built CONCURRENTLY so writes to extraction_jobs proceed during the build.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_webhook_delivery_status_active",
+            "extraction_jobs",
+            ["webhook_delivery_status"],
+            unique=False,
+            schema=schema,
+            postgresql_where=sa.text("webhook_delivery_status IN ('pending', 'failed')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
 
 def downgrade() -> None:
     schema = _schema()
 
     # Drop the index
-    op.drop_index(
-        "ix_webhook_delivery_status",
-        table_name="extraction_jobs",
-        schema=schema,
-    )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_webhook_delivery_status_active",
+            table_name="extraction_jobs",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
 
     # Remove webhook columns from extraction_jobs table
-    with op.batch_alter_table("extraction_jobs", schema=schema) as batch_op:
-        batch_op.drop_column("webhook_delivery_error")
-        batch_op.drop_column("webhook_delivery_status")
-        batch_op.drop_column("webhook_delivered")
-        batch_op.drop_column("webhook_url")
+    op.drop_column("extraction_jobs", "webhook_delivery_error", schema=schema)
+    op.drop_column("extraction_jobs", "webhook_delivery_status", schema=schema)
+    op.drop_column("extraction_jobs", "webhook_delivered", schema=schema)
+    op.drop_column("extraction_jobs", "webhook_url", schema=schema)
@@ -0,0 +1,53 @@
+"""drop_redundant_job_video_index
+
+Revision ID: 20261016_0003
+Revises: 20251231_0002
+Create Date: 2026-10-16
+
+Drops ix_video_id_job: lookups by video_id alone are served by the leading
+column of the composite ix_pending_jobs_lookup (video_id, language, job_status),
+so the single-column index only adds write amplification on every job update.
+"""
+
+from __future__ import annotations
+
+import os
+
+from alembic import op
+
+revision = "20261016_0003"
+down_revision = "20251231_0002"
+branch_labels = None
+depends_on = None
+
+
+def _schema() -> str:
+    return os.getenv("DB_SCHEMA", "youtube_subtitles")
+
+
+def upgrade() -> None:
+    schema = _schema()
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_video_id_job",
+            table_name="extraction_jobs",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = _schema()
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_video_id_job",
+            "extraction_jobs",
+            ["video_id"],
+            unique=False,
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
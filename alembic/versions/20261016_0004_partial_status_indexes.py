@@ -0,0 +1,96 @@
+"""partial_status_indexes
+
+Revision ID: 20261016_0004
+Revises: 20261016_0003
+Create Date: 2026-10-16
+
+Replaces the full-table ix_job_status and ix_webhook_delivery_status indexes
+with partial indexes covering only the states that are actually queried.
+Databases created from the current init/webhook revisions already have the
+partial indexes, so every step here is IF [NOT] EXISTS.
+"""
+
+from __future__ import annotations
+
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0004"
+down_revision = "20261016_0003"
+branch_labels = None
+depends_on = None
+
+_JOB_STATUS_ACTIVE = "job_status IN ('queued', 'processing', 'failed')"
+_WEBHOOK_STATUS_ACTIVE = "webhook_delivery_status IN ('pending', 'failed')"
+
+
+def _schema() -> str:
+    return os.getenv("DB_SCHEMA", "youtube_subtitles")
+
+
+def upgrade() -> None:
+    schema = _schema()
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_status_active",
+            "extraction_jobs",
+            ["job_status"],
+            unique=False,
+            schema=schema,
+            postgresql_where=sa.text(_JOB_STATUS_ACTIVE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_webhook_delivery_status_active",
+            "extraction_jobs",
+            ["webhook_delivery_status"],
+            unique=False,
+            schema=schema,
+            postgresql_where=sa.text(_WEBHOOK_STATUS_ACTIVE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_job_status",
+            table_name="extraction_jobs",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_webhook_delivery_status",
+            table_name="extraction_jobs",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = _schema()
+
+    # Restore the full indexes upgrade() dropped. The partial indexes stay:
+    # databases created from the current init/webhook revisions own them.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_status",
+            "extraction_jobs",
+            ["job_status"],
+            unique=False,
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_webhook_delivery_status",
+            "extraction_jobs",
+            ["webhook_delivery_status"],
+            unique=False,
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,81 @@
+"""partial_pending_jobs_index
+
+Revision ID: 20261016_0005
+Revises: 20261016_0004
+Create Date: 2026-10-16
+
+Replaces the full composite ix_pending_jobs_lookup (video_id, language,
+job_status) with ix_pending_jobs_active (video_id, language) restricted to the
+in-flight states the pending-job lookup queries. Completed/failed jobs, the
+bulk of the table, drop out of the index. Databases created from the current init
+revision already have ix_pending_jobs_covering (which 0006 switches to), so
+the partial index is only built when that covering index is absent.
+"""
+
+from __future__ import annotations
+
+import os
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "20261016_0005"
+down_revision = "20261016_0004"
+branch_labels = None
+depends_on = None
+
+
+def _schema() -> str:
+    return os.getenv("DB_SCHEMA", "youtube_subtitles")
+
+
+def _has_covering_index(schema: str) -> bool:
+    # Offline (--sql) runs can't inspect the database; emit the full script.
+    if context.is_offline_mode():
+        return False
+    indexes = sa.inspect(op.get_bind()).get_indexes("extraction_jobs", schema=schema)
+    return any(index["name"] == "ix_pending_jobs_covering" for index in indexes)
+
+
+def upgrade() -> None:
+    schema = _schema()
+    # Fresh databases already have the covering index from init; building
+    # ix_pending_jobs_active there would only have 0006 drop it again.
+    build_partial = not _has_covering_index(schema)
+
+    with op.get_context().autocommit_block():
+        if build_partial:
+            op.create_index(
+                "ix_pending_jobs_active",
+                "extraction_jobs",
+                ["video_id", "language"],
+                unique=False,
+                schema=schema,
+                postgresql_where=sa.text("job_status IN ('queued', 'processing')"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            "ix_pending_jobs_lookup",
+            table_name="extraction_jobs",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = _schema()
+
+    # Restore the composite index upgrade() dropped. ix_pending_jobs_active is
+    # left in place, as 0004 leaves its partial indexes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pending_jobs_lookup",
+            "extraction_jobs",
+            ["video_id", "language", "job_status"],
+            unique=False,
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,71 @@
+"""covering_pending_jobs_index
+
+Revision ID: 20261016_0006
+Revises: 20261016_0005
+Create Date: 2026-10-16
+
+Replaces ix_pending_jobs_active with ix_pending_jobs_covering: same keys and
+partial predicate, plus INCLUDE (job_id, attempt, created_at) so the pending
+job lookup is answered by an index-only scan. The new index is built before
+the old one is dropped, so lookups are never left unindexed. On databases
+created from the current init revision the covering index already exists and
+0005 skips ix_pending_jobs_active, so both steps here are no-ops.
+"""
+
+from __future__ import annotations
+
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261016_0006"
+down_revision = "20261016_0005"
+branch_labels = None
+depends_on = None
+
+
+def _schema() -> str:
+    return os.getenv("DB_SCHEMA", "youtube_subtitles")
+
+
+def upgrade() -> None:
+    schema = _schema()
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pending_jobs_covering",
+            "extraction_jobs",
+            ["video_id", "language"],
+            unique=False,
+            schema=schema,
+            postgresql_where=sa.text("job_status IN ('queued', 'processing')"),
+            postgresql_include=["job_id", "attempt", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_pending_jobs_active",
+            table_name="extraction_jobs",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = _schema()
+
+    # Restore the partial index upgrade() dropped. The covering index stays:
+    # databases created from the current init revision own it.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pending_jobs_active",
+            "extraction_jobs",
+            ["video_id", "language"],
+            unique=False,
+            schema=schema,
+            postgresql_where=sa.text("job_status IN ('queued', 'processing')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
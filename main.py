@@ -5,16 +5,20 @@ FastAPI service for extracting and caching YouTube subtitles.
 Integrates with async task queue (RQ) for subtitle extraction.
 """
 
+import asyncio
+import contextlib
 import logging
 import os
-import uuid
+import secrets
+import time
 from contextlib import asynccontextmanager
+from types import MappingProxyType
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.gzip import GZipMiddleware
+from brotli_asgi import BrotliMiddleware
 from fastapi.responses import Response
 import anyio
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
@@ -24,6 +28,7 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from src.api.routes import health, subtitles, admin
 from src.api.middleware import (
     APIVersionMiddleware,
+    LivenessProbeMiddleware,
     RateLimitHeadersMiddleware,
     create_error_response,
     ErrorCodeException,
@@ -34,7 +39,7 @@ from src.services.cache import CacheManager
 from src.services.database import DatabaseManager
 from src.services.rate_limiter import RateLimiter
 from src.services.in_memory_cache import InMemoryCache
-from src.services.job_queue import QueueConfig, queue_stats
+from src.services.job_queue import get_redis_connection, queue_config_from_settings, queue_stats
 from src.services.subtitle_orchestrator import SubtitleOrchestrator
 from src.metrics import job_queue_depth
 from src.services.security import get_client_ip
@@ -53,6 +58,17 @@ memory_cache: Optional[InMemoryCache] = None
 subtitle_orchestrator: Optional[SubtitleOrchestrator] = None
 
 
+async def _run_schema_init(app: FastAPI) -> None:
+    """Background schema init for MIGRATION_MODE=async."""
+    try:
+        await db_manager.init_schema(create_tables=settings.DB_AUTO_CREATE)
+        app.state.migration_status = {"state": "succeeded"}
+        logger.info("Database schema initialized")
+    except Exception as e:
+        app.state.migration_status = {"state": "failed", "error": str(e)[:500]}
+        logger.error(f"Background schema init failed: {e}", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -63,10 +79,15 @@ async def lifespan(app: FastAPI):
 
     # Startup
     logger.info("Initializing YouTube Subtitle API...")
+    migration_task: Optional[asyncio.Task] = None
 
     try:
         # Initialize services
-        cache_manager = CacheManager(redis_url=settings.REDIS_URL)
+        # Single async pool shared by the cache and the rate limiter.
+        cache_manager = CacheManager(
+            redis_url=settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
         await cache_manager.connect()
         logger.info("Cache manager initialized")
 
@@ -102,12 +123,12 @@ async def lifespan(app: FastAPI):
             ttl_seconds=int(os.getenv("MEMORY_CACHE_TTL_SECONDS", "300")),
         )
 
-        queue_cfg = QueueConfig(
-            redis_url=settings.REDIS_URL,
-            queue_name=settings.REDIS_QUEUE_NAME,
-            default_timeout=settings.YT_EXTRACTION_TIMEOUT + 10,
-            result_ttl=settings.REDIS_RESULT_TTL,
-        )
+        queue_cfg = queue_config_from_settings()
+        # Reused by /metrics and admin queue stats instead of rebuilt per call.
+        # RQ needs a sync, bytes-mode client, so it can't share the async pool;
+        # this is the same cached client the orchestrator's enqueue/fetch use.
+        app.state.queue_cfg = queue_cfg
+        app.state.queue_redis = get_redis_connection(queue_cfg.redis_url)
         subtitle_orchestrator = SubtitleOrchestrator(
             memory_cache=memory_cache,
             cache_manager=cache_manager,
@@ -117,8 +138,18 @@ async def lifespan(app: FastAPI):
         logger.info("Subtitle orchestrator initialized")
 
         # Initialize database schema (tables optional; prefer Alembic in production)
-        await db_manager.init_schema(create_tables=settings.DB_AUTO_CREATE)
-        logger.info("Database schema initialized")
+        # Already normalized by Settings; unknown values fall back to sync there
+        migration_mode = settings.MIGRATION_MODE
+        if migration_mode == "async":
+            # Accept traffic immediately; /health reports progress.
+            app.state.migration_status = {"state": "running"}
+            migration_task = asyncio.create_task(_run_schema_init(app))
+        elif migration_mode == "skip":
+            app.state.migration_status = {"state": "skipped"}
+        else:
+            await db_manager.init_schema(create_tables=settings.DB_AUTO_CREATE)
+            app.state.migration_status = {"state": "succeeded"}
+            logger.info("Database schema initialized")
 
         logger.info("YouTube Subtitle API started successfully")
 
@@ -130,9 +161,14 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down YouTube Subtitle API...")
+    if migration_task is not None and not migration_task.done():
+        migration_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await migration_task
     try:
         await cache_manager.disconnect()
         await db_manager.disconnect()
+        app.state.queue_redis.connection_pool.disconnect()
         logger.info("Services shutdown completed")
     except Exception as e:
         logger.error(f"Shutdown error: {e}", exc_info=True)
@@ -146,6 +182,8 @@ app = FastAPI(
     docs_url="/docs",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    # orjson encodes in C straight to bytes; subtitle payloads are large.
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -170,18 +208,25 @@ app.add_middleware(
     ],
 )
 
-# Middleware: Compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Middleware: Compression. Brotli for clients sending `Accept-Encoding: br`
+# (better ratio than gzip on subtitle text at similar CPU), gzip otherwise.
+app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1000, gzip_fallback=True)
 
-# Middleware: API Versioning (enabled by default for backward compatibility)
-if settings.API_DEPRECATED_PATH_REDIRECT:
-    app.add_middleware(APIVersionMiddleware)
+# Middleware: API Versioning. Legacy /api/* paths are redirected (default) or
+# rewritten to /api/v1/* so the routers are only mounted once.
+app.add_middleware(
+    APIVersionMiddleware, redirect=settings.API_DEPRECATED_PATH_REDIRECT
+)
 
 # Middleware: Rate Limit Headers
 app.add_middleware(RateLimitHeadersMiddleware)
 
 
 # Middleware: Request logging and rate limiting
+_RATE_LIMIT_EXEMPT_PATHS = frozenset({"/health", "/live", "/metrics"})
+_API_VERSION_HEADER = (b"x-api-version", settings.API_CURRENT_VERSION.encode("latin-1"))
+
+
 @app.middleware("http")
 async def request_logging_and_rate_limit(request: Request, call_next):
     """
@@ -191,9 +236,12 @@ async def request_logging_and_rate_limit(request: Request, call_next):
     - Attaches context to state
     - Adds rate limit headers via request state
     """
+    # Read the path straight from the ASGI scope; no URL object needed.
+    path = request.scope["path"]
+
     # Extract client IP (behind nginx-proxy)
     client_ip = get_client_ip(request)
-    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    request_id = request.headers.get("X-Request-ID") or secrets.token_hex(16)
 
     # Attach managers to request state
     request.state.cache_manager = cache_manager
@@ -206,29 +254,26 @@ async def request_logging_and_rate_limit(request: Request, call_next):
 
     # Rate limiting (skip health checks)
     rate_limit_info = None
-    if request.url.path not in ["/health", "/live", "/metrics"]:
+    if path not in _RATE_LIMIT_EXEMPT_PATHS:
         # Some test transports don't execute lifespan hooks; fail open if uninitialized.
         if rate_limiter is not None:
             allowed, remaining, reset_at, info = await rate_limiter.check_rate_limit(
-                client_ip, request.url.path
+                client_ip, path
             )
             rate_limit_info = info
-            # Store for header middleware
-            request.state.rate_limit_info = {
-                "limit": info.limit,
-                "remaining": info.remaining,
-                "reset_at": info.reset_at,
-            }
+            # Store for header middleware (read as attributes, no dict copy)
+            request.state.rate_limit_info = info
 
             if not allowed:
-                logger.warning(
-                    f"Rate limit exceeded for {client_ip} on {request.url.path}",
-                    extra={
-                        "client_ip": client_ip,
-                        "path": request.url.path,
-                        "request_id": request_id,
-                    },
-                )
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        f"Rate limit exceeded for {client_ip} on {path}",
+                        extra={
+                            "client_ip": client_ip,
+                            "path": path,
+                            "request_id": request_id,
+                        },
+                    )
                 retry_after = max(0, int((reset_at - utc_now()).total_seconds()))
                 return create_error_response(
                     error_code="RATE_LIMIT_EXCEEDED",
@@ -237,33 +282,54 @@ async def request_logging_and_rate_limit(request: Request, call_next):
                 )
 
     # Log request start
-    start_time = utc_now()
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-    response.headers["X-API-Version"] = settings.API_CURRENT_VERSION
-
-    # Log request completion
-    duration_ms = (utc_now() - start_time).total_seconds() * 1000
-    logger.info(
-        "Request completed",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "duration_ms": duration_ms,
-            "client_ip": client_ip,
-            "request_id": request_id,
-        },
-    )
+    # Append pre-encoded raw headers; skips MutableHeaders' per-call
+    # lowercasing/encoding and the search for an existing key.
+    response.raw_headers.append((b"x-request-id", request_id.encode("latin-1")))
+    response.raw_headers.append(_API_VERSION_HEADER)
+
+    # Log request completion (skip building `extra` when INFO is disabled)
+    if logger.isEnabledFor(logging.INFO):
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "Request completed",
+            extra={
+                "method": request.method,
+                "path": path,
+                "status_code": response.status_code,
+                "duration_ms": duration_ms,
+                "client_ip": client_ip,
+                "request_id": request_id,
+            },
+        )
 
     return response
 
 
+# Middleware: /live fast path. Added last so it is the outermost user
+# middleware and answers probes before any of the above run.
+app.add_middleware(LivenessProbeMiddleware)
+
+
 # Error handlers
+# Map HTTP status codes to error codes
+_HTTP_STATUS_ERROR_CODES = MappingProxyType(
+    {
+        401: "UNAUTHORIZED",
+        403: "FORBIDDEN",
+        404: "SUBTITLE_NOT_FOUND",
+        429: "RATE_LIMIT_EXCEEDED",
+        500: "INTERNAL_ERROR",
+        503: "SERVICE_UNAVAILABLE",
+    }
+)
+
+
 @app.exception_handler(ErrorCodeException)
 async def error_code_exception_handler(request: Request, exc: ErrorCodeException):
     """Custom ErrorCodeException handler with standardized error response."""
-    request_id = getattr(request.state, "request_id", uuid.uuid4().hex)
+    request_id = getattr(request.state, "request_id", None) or secrets.token_hex(16)
     logger.warning(
         f"ErrorCodeException {exc.error_code}: {exc.detail}",
         extra={"path": request.url.path, "request_id": request_id},
@@ -280,19 +346,8 @@ async def error_code_exception_handler(request: Request, exc: ErrorCodeException
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Custom HTTP exception handler with standardized error response."""
-    request_id = getattr(request.state, "request_id", uuid.uuid4().hex)
-
-    # Map HTTP status codes to error codes
-    error_code_map = {
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "SUBTITLE_NOT_FOUND",
-        429: "RATE_LIMIT_EXCEEDED",
-        500: "INTERNAL_ERROR",
-        503: "SERVICE_UNAVAILABLE",
-    }
-
-    error_code = error_code_map.get(exc.status_code, "INTERNAL_ERROR")
+    request_id = getattr(request.state, "request_id", None) or secrets.token_hex(16)
+    error_code = _HTTP_STATUS_ERROR_CODES.get(exc.status_code, "INTERNAL_ERROR")
     logger.error(
         f"HTTP error {exc.status_code}: {exc.detail}",
         extra={"path": request.url.path, "request_id": request_id},
@@ -308,7 +363,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Catch-all exception handler for unhandled errors."""
-    request_id = getattr(request.state, "request_id", uuid.uuid4().hex)
+    request_id = getattr(request.state, "request_id", None) or secrets.token_hex(16)
     logger.error(
         f"Unhandled exception: {exc}",
         exc_info=True,
@@ -325,10 +380,6 @@ app.include_router(health.router, prefix="", tags=["Health"])
 app.include_router(subtitles.router, prefix="/api/v1", tags=["Subtitles"])
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
 
-# Backward compatibility: include legacy routes (redirects handled by middleware)
-app.include_router(subtitles.router, prefix="/api", tags=["Subtitles (Deprecated)"])
-app.include_router(admin.router, prefix="/api/admin", tags=["Admin (Deprecated)"])
-
 # Metrics
 if settings.PROMETHEUS_ENABLED:
     Instrumentator().instrument(app)
@@ -337,14 +388,14 @@ if settings.PROMETHEUS_ENABLED:
 @app.get("/metrics")
 async def metrics():
     if settings.PROMETHEUS_ENABLED:
-        # Keep queue depth fresh for scrapes.
-        cfg = QueueConfig(
-            redis_url=settings.REDIS_URL,
-            queue_name=settings.REDIS_QUEUE_NAME,
-            default_timeout=settings.YT_EXTRACTION_TIMEOUT + 10,
-            result_ttl=settings.REDIS_RESULT_TTL,
+        # Keep queue depth fresh for scrapes. Without lifespan state (e.g. a
+        # bare TestClient) fall back to a settings-built config and the
+        # shared per-URL connection.
+        stats = await anyio.to_thread.run_sync(
+            queue_stats,
+            getattr(app.state, "queue_cfg", None) or queue_config_from_settings(),
+            getattr(app.state, "queue_redis", None),
         )
-        stats = await anyio.to_thread.run_sync(lambda: queue_stats(cfg))
         job_queue_depth.set(stats.get("queue_depth", 0))
         return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
     return Response(status_code=404)
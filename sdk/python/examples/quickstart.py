@@ -27,55 +27,52 @@ BASE_URL = os.getenv("YOUTUBE_SUBTITLE_API_URL", "https://api.expertbeacon.com")
 WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "your-webhook-secret")
 
 
-def example_1_basic_usage():
-    """Example 1: Basic synchronous usage with context manager."""
+def example_1_basic_usage(client: YouTubeSubtitleAPI):
+    """Example 1: Basic synchronous usage."""
     print("Example 1: Basic Usage")
     print("-" * 50)
 
-    # Use context manager for automatic cleanup
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        # Extract subtitles using video ID
-        result = client.extract_subtitles(
-            video_id="dQw4w9WgXcQ",  # Rick Astley - Never Gonna Give You Up
-            language="en"
-        )
-
-        # Handle both cached results and queued jobs
-        if isinstance(result, Subtitle):
-            print(f"Got {len(result.subtitles)} subtitle items")
-            print(f"Title: {result.title}")
-            print(f"Duration: {result.total_duration:.1f} seconds")
-            print(f"Word count: {result.word_count}")
-            print(f"\nFirst line: {result.subtitles[0].text}")
-        elif isinstance(result, QueuedResponse):
-            print(f"Job queued: {result.job_id}")
-            # Wait for completion
-            subtitle = client.wait_for_job(result.job_id, timeout=60)
-            print(f"Got {len(subtitle.subtitles)} subtitle items after waiting")
+    # Extract subtitles using video ID
+    result = client.extract_subtitles(
+        video_id="dQw4w9WgXcQ",  # Rick Astley - Never Gonna Give You Up
+        language="en"
+    )
+
+    # Handle both cached results and queued jobs
+    if isinstance(result, Subtitle):
+        print(f"Got {len(result.subtitles)} subtitle items")
+        print(f"Title: {result.title}")
+        print(f"Duration: {result.total_duration:.1f} seconds")
+        print(f"Word count: {result.word_count}")
+        print(f"\nFirst line: {result.subtitles[0].text}")
+    elif isinstance(result, QueuedResponse):
+        print(f"Job queued: {result.job_id}")
+        # Wait for completion
+        subtitle = client.wait_for_job(result.job_id, timeout=60)
+        print(f"Got {len(subtitle.subtitles)} subtitle items after waiting")
 
     print()
 
 
-def example_2_using_url():
+def example_2_using_url(client: YouTubeSubtitleAPI):
     """Example 2: Extract using YouTube URL instead of video ID."""
     print("Example 2: Using YouTube URL")
     print("-" * 50)
 
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        # Extract using full YouTube URL
-        result = client.extract_subtitles(
-            video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            language="en"
-        )
+    # Extract using full YouTube URL
+    result = client.extract_subtitles(
+        video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        language="en"
+    )
 
-        if isinstance(result, Subtitle):
-            print(f"Extracted from URL: {result.video_id}")
-            print(f"Plain text preview: {result.plain_text[:200]}...")
+    if isinstance(result, Subtitle):
+        print(f"Extracted from URL: {result.video_id}")
+        print(f"Plain text preview: {result.plain_text[:200]}...")
 
     print()
 
 
-def example_3_batch_processing():
+async def example_3_batch_processing(client: AsyncYouTubeSubtitleAPI):
     """Example 3: Batch processing multiple videos."""
     print("Example 3: Batch Processing")
     print("-" * 50)
@@ -85,103 +82,110 @@ def example_3_batch_processing():
         # Add more video IDs as needed
     ]
 
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        # Batch extraction
-        batch_result = client.extract_batch(video_ids, language="en")
+    # Batch extraction
+    batch_result = await client.extract_batch(video_ids, language="en")
 
-        print(f"Total videos: {batch_result.video_count}")
-        print(f"Queued for extraction: {batch_result.queued_count}")
-        print(f"Found in cache: {batch_result.cached_count}")
+    print(f"Total videos: {batch_result.video_count}")
+    print(f"Queued for extraction: {batch_result.queued_count}")
+    print(f"Found in cache: {batch_result.cached_count}")
 
-        # Wait for all queued jobs
-        all_subtitles = []
-        for job_id in batch_result.job_ids:
-            try:
-                subtitle = client.wait_for_job(job_id, timeout=120)
-                all_subtitles.append(subtitle)
-                print(f"  Job {job_id[:8]}... completed")
-            except Exception as e:
-                print(f"  Job {job_id[:8]}... failed: {e}")
+    # Wait for all queued jobs concurrently, keeping at most 10 polls
+    # in flight at a time
+    semaphore = asyncio.Semaphore(10)
 
-        print(f"Total subtitles extracted: {len(all_subtitles)}")
+    async def wait(job_id: str) -> Subtitle:
+        async with semaphore:
+            return await client.wait_for_job(job_id, timeout=120)
+
+    results = await asyncio.gather(
+        *(wait(job_id) for job_id in batch_result.job_ids),
+        return_exceptions=True,
+    )
+
+    all_subtitles = []
+    for job_id, result in zip(batch_result.job_ids, results):
+        if isinstance(result, Exception):
+            print(f"  Job {job_id[:8]}... failed: {result}")
+        else:
+            all_subtitles.append(result)
+            print(f"  Job {job_id[:8]}... completed")
+
+    print(f"Total subtitles extracted: {len(all_subtitles)}")
 
     print()
 
 
-def example_4_error_handling():
+def example_4_error_handling(client: YouTubeSubtitleAPI):
     """Example 4: Proper error handling."""
     print("Example 4: Error Handling")
     print("-" * 50)
 
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        try:
-            # Try to get subtitles that might not exist
-            subtitle = client.get_subtitles("nonexistent_video_id")
-            print(subtitle.plain_text)
-        except NotFoundError as e:
-            print(f"Not found: {e.message}")
-            print(f"Hint: {e.hint}")
-        except RateLimitError as e:
-            print(f"Rate limited: {e.message}")
-            print(f"Wait before retrying")
-        except YouTubeSubtitleAPIError as e:
-            print(f"API error: {e.message}")
+    try:
+        # Try to get subtitles that might not exist
+        subtitle = client.get_subtitles("nonexistent_video_id")
+        print(subtitle.plain_text)
+    except NotFoundError as e:
+        print(f"Not found: {e.message}")
+        print(f"Hint: {e.hint}")
+    except RateLimitError as e:
+        print(f"Rate limited: {e.message}")
+        print(f"Wait before retrying")
+    except YouTubeSubtitleAPIError as e:
+        print(f"API error: {e.message}")
 
     print()
 
 
-def example_5_export_formats():
+def example_5_export_formats(client: YouTubeSubtitleAPI):
     """Example 5: Export subtitles in different formats."""
     print("Example 5: Export Formats")
     print("-" * 50)
 
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        result = client.extract_subtitles("dQw4w9WgXcQ")
+    result = client.extract_subtitles("dQw4w9WgXcQ")
 
-        if isinstance(result, Subtitle):
-            # Export as SRT
-            srt_content = result.to_srt()
-            print("SRT format (first 200 chars):")
-            print(srt_content[:200] + "...")
+    if isinstance(result, Subtitle):
+        # Export as SRT
+        srt_content = result.to_srt()
+        print("SRT format (first 200 chars):")
+        print(srt_content[:200] + "...")
 
-            print("\n" + "=" * 50 + "\n")
+        print("\n" + "=" * 50 + "\n")
 
-            # Export as VTT
-            vtt_content = result.to_vtt()
-            print("VTT format (first 200 chars):")
-            print(vtt_content[:200] + "...")
+        # Export as VTT
+        vtt_content = result.to_vtt()
+        print("VTT format (first 200 chars):")
+        print(vtt_content[:200] + "...")
 
-            # Save to files
-            # with open("subtitles.srt", "w") as f:
-            #     f.write(srt_content)
-            # with open("subtitles.vtt", "w") as f:
-            #     f.write(vtt_content)
+        # Save to files
+        # with open("subtitles.srt", "w") as f:
+        #     f.write(srt_content)
+        # with open("subtitles.vtt", "w") as f:
+        #     f.write(vtt_content)
 
     print()
 
 
-def example_6_search_subtitles():
+def example_6_search_subtitles(client: YouTubeSubtitleAPI):
     """Example 6: Search within subtitles."""
     print("Example 6: Search Subtitles")
     print("-" * 50)
 
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        result = client.extract_subtitles("dQw4w9WgXcQ")
+    result = client.extract_subtitles("dQw4w9WgXcQ")
 
-        if isinstance(result, Subtitle):
-            # Search for specific text
-            query = "never"
-            matches = result.search_text(query)
+    if isinstance(result, Subtitle):
+        # Search for specific text
+        query = "never"
+        matches = result.search_text(query)
 
-            print(f"Found {len(matches)} matches for '{query}':")
-            for item in matches[:5]:  # Show first 5 matches
-                print(f"  [{item.start:.1f}s] {item.text}")
+        print(f"Found {len(matches)} matches for '{query}':")
+        for item in matches[:5]:  # Show first 5 matches
+            print(f"  [{item.start:.1f}s] {item.text}")
 
-            # Get subtitles by time range
-            print(f"\nSubtitles from 10-20 seconds:")
-            items = result.get_text_by_time_range(10.0, 20.0)
-            for item in items:
-                print(f"  [{item.start:.1f}s] {item.text}")
+        # Get subtitles by time range
+        print(f"\nSubtitles from 10-20 seconds:")
+        items = result.get_text_by_time_range(10.0, 20.0)
+        for item in items:
+            print(f"  [{item.start:.1f}s] {item.text}")
 
     print()
 
@@ -211,24 +215,23 @@ def example_7_custom_config():
     print()
 
 
-async def example_8_async_usage():
+async def example_8_async_usage(client: AsyncYouTubeSubtitleAPI):
     """Example 8: Asynchronous usage."""
     print("Example 8: Async Usage")
     print("-" * 50)
 
-    async with AsyncYouTubeSubtitleAPI(api_key=API_KEY) as client:
-        result = await client.extract_subtitles("dQw4w9WgXcQ")
+    result = await client.extract_subtitles("dQw4w9WgXcQ")
 
-        if isinstance(result, Subtitle):
-            print(f"Got {len(result.subtitles)} subtitle items (async)")
-        elif isinstance(result, QueuedResponse):
-            subtitle = await client.wait_for_job(result.job_id, timeout=60)
-            print(f"Got {len(subtitle.subtitles)} subtitle items after waiting")
+    if isinstance(result, Subtitle):
+        print(f"Got {len(result.subtitles)} subtitle items (async)")
+    elif isinstance(result, QueuedResponse):
+        subtitle = await client.wait_for_job(result.job_id, timeout=60)
+        print(f"Got {len(subtitle.subtitles)} subtitle items after waiting")
 
     print()
 
 
-async def example_9_parallel_extraction():
+async def example_9_parallel_extraction(client: AsyncYouTubeSubtitleAPI):
     """Example 9: Parallel extraction with async client."""
     print("Example 9: Parallel Extraction")
     print("-" * 50)
@@ -238,48 +241,66 @@ async def example_9_parallel_extraction():
         # Add more video IDs
     ]
 
-    async with AsyncYouTubeSubtitleAPI(api_key=API_KEY) as client:
-        # Extract multiple videos in parallel
-        results = await client.extract_subtitles_batch_parallel(
-            video_ids,
-            concurrency=5,
-            language="en"
-        )
-
-        for video_id, result in results:
-            if isinstance(result, Exception):
-                print(f"{video_id}: ERROR - {result}")
-            elif isinstance(result, Subtitle):
-                print(f"{video_id}: {len(result.subtitles)} items, {result.word_count} words")
-            elif isinstance(result, QueuedResponse):
-                print(f"{video_id}: Queued - {result.job_id}")
+    # Extract multiple videos in parallel
+    results = await client.extract_subtitles_batch_parallel(
+        video_ids,
+        concurrency=5,
+        language="en"
+    )
+
+    for video_id, result in results:
+        if isinstance(result, Exception):
+            print(f"{video_id}: ERROR - {result}")
+        elif isinstance(result, Subtitle):
+            print(f"{video_id}: {len(result.subtitles)} items, {result.word_count} words")
+        elif isinstance(result, QueuedResponse):
+            print(f"{video_id}: Queued - {result.job_id}")
 
     print()
 
 
-def example_10_get_job_status():
+def example_10_get_job_status(client: YouTubeSubtitleAPI):
     """Example 10: Check job status without waiting."""
     print("Example 10: Job Status")
     print("-" * 50)
 
-    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
-        # Start an extraction (will likely queue)
-        result = client.extract_subtitles("some_video_id")
+    # Start an extraction (will likely queue)
+    result = client.extract_subtitles("some_video_id")
 
-        if isinstance(result, QueuedResponse):
-            job_id = result.job_id
-            print(f"Job ID: {job_id}")
+    if isinstance(result, QueuedResponse):
+        job_id = result.job_id
+        print(f"Job ID: {job_id}")
 
-            # Check status without blocking
-            job = client.get_job_status(job_id)
-            print(f"Status: {job.status}")
-            print(f"Is pending: {job.is_pending}")
-            print(f"Is complete: {job.is_complete}")
-            print(f"Is failed: {job.is_failed}")
+        # Check status without blocking
+        job = client.get_job_status(job_id)
+        print(f"Status: {job.status}")
+        print(f"Is pending: {job.is_pending}")
+        print(f"Is complete: {job.is_complete}")
+        print(f"Is failed: {job.is_failed}")
 
     print()
 
 
+def run_sync_examples():
+    """Run the sync examples on one shared client and connection pool."""
+    # Use context manager for automatic cleanup
+    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
+        example_1_basic_usage(client)
+        example_2_using_url(client)
+        example_4_error_handling(client)
+        example_5_export_formats(client)
+        example_6_search_subtitles(client)
+        example_10_get_job_status(client)
+
+
+async def run_async_examples():
+    """Run the async examples on one shared client and connection pool."""
+    async with AsyncYouTubeSubtitleAPI(api_key=API_KEY) as client:
+        await example_3_batch_processing(client)
+        await example_8_async_usage(client)
+        await example_9_parallel_extraction(client)
+
+
 def main():
     """Run all examples."""
     print("=" * 50)
@@ -288,19 +309,12 @@ def main():
     print()
 
     # Run synchronous examples
-    example_1_basic_usage()
-    example_2_using_url()
-    example_3_batch_processing()
-    example_4_error_handling()
-    example_5_export_formats()
-    example_6_search_subtitles()
+    run_sync_examples()
     example_7_custom_config()
-    example_10_get_job_status()
 
     # Run async examples
     print("\nRunning async examples...")
-    asyncio.run(example_8_async_usage())
-    asyncio.run(example_9_parallel_extraction())
+    asyncio.run(run_async_examples())
 
     print("\nAll examples completed!")
 
@@ -310,13 +324,12 @@ if __name__ == "__main__":
     # main()
 
     # Or run individual examples
-    example_1_basic_usage()
-    # example_2_using_url()
-    # example_3_batch_processing()
-    # example_4_error_handling()
-    # example_5_export_formats()
-    # example_6_search_subtitles()
+    with YouTubeSubtitleAPI(api_key=API_KEY) as client:
+        example_1_basic_usage(client)
+        # example_2_using_url(client)
+        # example_4_error_handling(client)
+        # example_5_export_formats(client)
+        # example_6_search_subtitles(client)
+        # example_10_get_job_status(client)
     # example_7_custom_config()
-    # asyncio.run(example_8_async_usage())
-    # asyncio.run(example_9_parallel_extraction())
-    # example_10_get_job_status()
+    # asyncio.run(run_async_examples())  # examples 3, 8 and 9
@@ -5,28 +5,39 @@ This example demonstrates how to set up a webhook handler using FastAPI
 to receive notifications when subtitle extraction jobs complete.
 """
 
+import logging
 import os
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import BackgroundTasks, FastAPI, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 
+from youtube_subtitle_api.cache import InMemoryCache
 from youtube_subtitle_api.webhook import (
     verify_signature,
     parse_webhook,
-    verify_and_parse_webhook,
+    verify_and_parse_webhook_async,
     WebhookVerifier,
 )
 from youtube_subtitle_api.models import WebhookEvent
 
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "your-webhook-secret")
 
+# Keyed once at import; each request only hashes its own payload
+verifier = WebhookVerifier(secret=WEBHOOK_SECRET, require_timestamp=False)
+
 # Create FastAPI app
-app = FastAPI(title="YouTube Subtitle Webhook Handler")
+app = FastAPI(
+    title="YouTube Subtitle Webhook Handler",
+    default_response_class=ORJSONResponse,
+)
 
 
-# Store completed jobs (in production, use a database)
-completed_jobs = {}
+# Store completed jobs (in production, use a database). Bounded and
+# expiring so a long-running handler doesn't grow without limit.
+completed_jobs = InMemoryCache(max_size=10_000, ttl=3600)
 
 
 @app.get("/")
@@ -38,20 +49,56 @@ async def root():
 @app.get("/jobs/{job_id}")
 async def get_job_result(job_id: str):
     """Get the result of a completed job."""
-    if job_id not in completed_jobs:
+    job = completed_jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return completed_jobs[job_id]
+    return job
+
+
+def process_event(event: WebhookEvent) -> None:
+    """Record a webhook event; runs after the response has been sent."""
+    job = {
+        "job_id": event.job_id,
+        "video_id": event.video_id,
+        "status": event.status,
+        "timestamp": event.timestamp,
+    }
+
+    if event.is_success:
+        subtitle = event.subtitle
+        logger.info(
+            "Job %s completed successfully (video %s, %d subtitles)",
+            event.job_id,
+            event.video_id,
+            len(subtitle.subtitles),
+        )
+
+        # Store subtitle data with a short transcript preview
+        preview = subtitle.plain_text_prefix(500)
+        job["subtitle"] = {
+            "title": subtitle.title,
+            "language": subtitle.language,
+            "subtitle_count": subtitle.subtitle_count,
+            "word_count": subtitle.word_count,
+            "plain_text": f"{preview}..." if preview else None,
+        }
+    else:
+        logger.warning("Job %s failed: %s", event.job_id, event.error)
+        job["error"] = event.error
+
+    # Store the result
+    completed_jobs.set(event.job_id, job)
 
 
 @app.post("/webhook/subtitle")
-async def handle_webhook(request: Request):
+async def handle_webhook(request: Request, background_tasks: BackgroundTasks):
     """
     Handle webhook POST requests from the YouTube Subtitle API.
 
     This endpoint:
     1. Verifies the HMAC signature
     2. Parses the webhook payload
-    3. Processes the event
+    3. Acknowledges immediately and processes the event in the background
     """
     payload = await request.body()
     signature = request.headers.get("X-Webhook-Signature", "")
@@ -64,35 +111,11 @@ async def handle_webhook(request: Request):
     # Parse webhook
     event = parse_webhook(payload)
 
-    # Store the result
-    completed_jobs[event.job_id] = {
-        "job_id": event.job_id,
-        "video_id": event.video_id,
-        "status": event.status,
-        "timestamp": event.timestamp,
-    }
+    # The sender only needs the acknowledgement; bookkeeping runs after
+    # the response (in the threadpool, so it doesn't block the event loop)
+    background_tasks.add_task(process_event, event)
 
-    # Process the event
-    if event.is_success:
-        subtitle = event.subtitle
-        print(f"Job {event.job_id} completed successfully")
-        print(f"  Video ID: {event.video_id}")
-        print(f"  Subtitle count: {len(subtitle.subtitles)}")
-        print(f"  Word count: {subtitle.word_count}")
-
-        # Store subtitle data
-        completed_jobs[event.job_id]["subtitle"] = {
-            "title": subtitle.title,
-            "language": subtitle.language,
-            "subtitle_count": subtitle.subtitle_count,
-            "word_count": subtitle.word_count,
-            "plain_text": subtitle.plain_text[:500] + "..." if subtitle.plain_text else None,
-        }
-    else:
-        print(f"Job {event.job_id} failed: {event.error}")
-        completed_jobs[event.job_id]["error"] = event.error
-
-    return JSONResponse(content={"status": "received", "job_id": event.job_id})
+    return ORJSONResponse(content={"status": "received", "job_id": event.job_id})
 
 
 @app.post("/webhook/subtitle/verifier")
@@ -106,9 +129,6 @@ async def handle_webhook_with_verifier(request: Request):
     signature = request.headers.get("X-Webhook-Signature", "")
     timestamp = request.headers.get("X-Webhook-Timestamp", "")
 
-    # Create verifier
-    verifier = WebhookVerifier(secret=WEBHOOK_SECRET, require_timestamp=False)
-
     try:
         # Verify and parse in one step
         event = verifier.verify_and_parse(payload, signature, timestamp)
@@ -116,7 +136,7 @@ async def handle_webhook_with_verifier(request: Request):
         raise HTTPException(status_code=401, detail=str(e))
 
     # Process event
-    print(f"Received webhook for job {event.job_id}: {event.status}")
+    logger.info("Received webhook for job %s: %s", event.job_id, event.status)
 
     return {"status": "received", "job_id": event.job_id}
 
@@ -124,16 +144,19 @@ async def handle_webhook_with_verifier(request: Request):
 @app.post("/webhook/subtitle/combined")
 async def handle_webhook_combined(request: Request):
     """
-    Handle webhook using the combined verify_and_parse_webhook function.
+    Handle webhook using the combined verify_and_parse_webhook_async function.
 
-    This is the most concise approach.
+    This is the most concise approach; large payloads are verified and
+    parsed in a worker thread instead of on the event loop.
     """
     payload = await request.body()
     signature = request.headers.get("X-Webhook-Signature", "")
     timestamp = request.headers.get("X-Webhook-Timestamp", "")
 
     try:
-        event = verify_and_parse_webhook(payload, signature, WEBHOOK_SECRET, timestamp)
+        event = await verify_and_parse_webhook_async(
+            payload, signature, WEBHOOK_SECRET, timestamp
+        )
     except ValueError as e:
         raise HTTPException(status_code=401, detail="Invalid signature")
 
@@ -147,19 +170,21 @@ async def handle_webhook_combined(request: Request):
 
 
 def run_server():
-    """Run the webhook server."""
+    """Run the webhook server (uvloop where available, httptools parser)."""
     import uvicorn
 
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8000,
-        log_level="info",
+        loop="auto",  # uvloop when installed (not available on Windows)
+        http="httptools",
+        log_level="warning",
     )
 
 
 if __name__ == "__main__":
-    import uvicorn
+    logging.basicConfig(level=logging.INFO)
 
     print("Starting webhook server on http://0.0.0.0:8000")
     print("Webhook endpoint: http://0.0.0.0:8000/webhook/subtitle")
@@ -171,4 +196,4 @@ if __name__ == "__main__":
     print('    -d \'{"event":"job.completed","job_id":"123","video_id":"abc","status":"success"}\'')
     print()
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    run_server()
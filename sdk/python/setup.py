@@ -38,7 +38,7 @@ setup(
     ],
     python_requires=">=3.11",
     install_requires=[
-        "httpx>=0.27.0,<1.0.0",
+        "httpx[http2]>=0.27.0,<1.0.0",
     ],
     extras_require={
         "dev": [
@@ -51,6 +51,10 @@ setup(
         ],
         "fastapi": [
             "fastapi>=0.115.0",
+            "orjson>=3.10.0",
+            "uvicorn>=0.30.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+            "httptools>=0.6.0",
         ],
     },
     keywords=[
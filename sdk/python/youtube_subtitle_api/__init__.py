@@ -14,14 +14,17 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
+import random
 import re
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Optional, Union
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union
 
 import httpx
 
+from .cache import InMemoryCache
 from .errors import (
     APIError,
     AuthenticationError,
@@ -31,7 +34,15 @@ from .errors import (
     ValidationError,
     YouTubeSubtitleAPIError,
 )
-from .models import JobStatus, Subtitle, SubtitleItem, WebhookEvent
+from .models import (
+    _JOB_STATUS_BY_VALUE,
+    JobStatus,
+    Subtitle,
+    SubtitleItem,
+    WebhookEvent,
+    _json_dumps,
+    _json_loads,
+)
 from .webhook import verify_signature
 
 __all__ = [
@@ -40,6 +51,7 @@ __all__ = [
     "AsyncYouTubeSubtitleAPI",
     # Configuration
     "Config",
+    "InMemoryCache",
     # Models
     "Subtitle",
     "SubtitleItem",
@@ -63,6 +75,32 @@ __license__ = "MIT"
 
 logger = logging.getLogger(__name__)
 
+_JOB_PATH = "/api/v1/job/"
+
+# Largest batch POST /api/v1/subtitles/batch accepts
+_BATCH_MAX_VIDEOS = 100
+
+# Gateway errors worth retrying for idempotent requests
+_RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+# Backoff for batch helper retries when the API gives no retry_after
+_BATCH_RETRY_BASE_DELAY = 1.0
+_BATCH_RETRY_MAX_DELAY = 30.0
+
+# Upper bound the API accepts for GET /api/v1/job/{id}/wait
+_LONG_POLL_MAX_SECONDS = 25.0
+
+# httpx only speaks HTTP/2 when the optional h2 package is importable
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Polls and parallel extractions multiplex over one HTTP/2 connection;
+# the limits matter when the server falls back to HTTP/1.1.
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
 
 # Video ID validation pattern
 VIDEO_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{11}$")
@@ -71,6 +109,15 @@ YOUTUBE_URL_PATTERN = re.compile(
     r"(?:watch\?v=|shorts/)?([a-zA-Z0-9_-]{11})"
 )
 
+_VIDEO_ID_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+)
+
+
+def _is_valid_video_id(value: str) -> bool:
+    """Check the 11-character video ID format without running a regex."""
+    return len(value) == 11 and _VIDEO_ID_CHARS.issuperset(value)
+
 
 def extract_video_id(input_str: str) -> str:
     """
@@ -86,13 +133,15 @@ def extract_video_id(input_str: str) -> str:
         InvalidVideoIDError: If the input is not a valid URL or video ID
     """
     # Direct video ID match
-    if VIDEO_ID_PATTERN.match(input_str):
+    if _is_valid_video_id(input_str):
         return input_str
 
-    # URL extraction
-    match = YOUTUBE_URL_PATTERN.search(input_str)
-    if match:
-        return match.group(1)
+    # URL extraction; every URL the pattern accepts contains "youtu", so
+    # skip the regex scan for anything that can't match
+    if "youtu" in input_str:
+        match = YOUTUBE_URL_PATTERN.search(input_str)
+        if match:
+            return match.group(1)
 
     raise InvalidVideoIDError(
         f"Invalid YouTube URL or video ID: {input_str}. "
@@ -100,7 +149,7 @@ def extract_video_id(input_str: str) -> str:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     SDK configuration.
@@ -121,16 +170,10 @@ class Config:
 
     def with_api_key(self, api_key: str) -> "Config":
         """Return a new Config with the API key set."""
-        return Config(
-            api_key=api_key,
-            base_url=self.base_url,
-            timeout=self.timeout,
-            max_retries=self.max_retries,
-            webhook_secret=self.webhook_secret,
-        )
+        return replace(self, api_key=api_key)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionRequest:
     """
     Request parameters for subtitle extraction.
@@ -151,21 +194,19 @@ class ExtractionRequest:
 
     def __post_init__(self):
         """Validate and normalize the request."""
-        if not self.video_id and not self.video_url:
+        if self.video_id:
+            if not _is_valid_video_id(self.video_id):
+                raise InvalidVideoIDError(
+                    f"Invalid video ID format: {self.video_id}"
+                )
+        elif self.video_url:
+            # extract_video_id only ever returns well-formed IDs
+            self.video_id = extract_video_id(self.video_url)
+        else:
             raise ValidationError(
                 "Either video_id or video_url must be provided"
             )
 
-        # Extract video ID from URL if needed
-        if self.video_url and not self.video_id:
-            object.__setattr__(self, "video_id", extract_video_id(self.video_url))
-
-        # Validate video ID format
-        if self.video_id and not VIDEO_ID_PATTERN.match(self.video_id):
-            raise InvalidVideoIDError(
-                f"Invalid video ID format: {self.video_id}"
-            )
-
     def to_dict(self) -> dict[str, Any]:
         """Convert to API request dictionary."""
         payload: dict[str, Any] = {
@@ -181,13 +222,13 @@ class ExtractionRequest:
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchExtractionRequest:
     """
     Request parameters for batch subtitle extraction.
 
     Attributes:
-        video_ids: List of YouTube video IDs (up to 100)
+        video_ids: List of YouTube video IDs (up to 100 after duplicates are removed)
         language: Subtitle language code (default: "en")
         clean_for_ai: Normalize text for AI consumption (default: True)
         webhook_url: Optional webhook URL for async completion notifications
@@ -203,13 +244,21 @@ class BatchExtractionRequest:
         if not self.video_ids:
             raise ValidationError("video_ids cannot be empty")
 
-        if len(self.video_ids) > 100:
-            raise ValidationError("video_ids cannot exceed 100 items")
-
-        # Validate all video IDs
+        # Validate each distinct video ID once and drop repeats, keeping
+        # first-seen order so the server doesn't queue duplicate work
+        seen: set[str] = set()
+        unique: list[str] = []
         for vid in self.video_ids:
-            if not VIDEO_ID_PATTERN.match(vid):
+            if vid in seen:
+                continue
+            if not _is_valid_video_id(vid):
                 raise InvalidVideoIDError(f"Invalid video ID format: {vid}")
+            seen.add(vid)
+            unique.append(vid)
+        self.video_ids = unique
+
+        if len(self.video_ids) > _BATCH_MAX_VIDEOS:
+            raise ValidationError(f"video_ids cannot exceed {_BATCH_MAX_VIDEOS} items")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to API request dictionary."""
@@ -225,7 +274,7 @@ class BatchExtractionRequest:
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class JobInfo:
     """
     Information about an extraction job.
@@ -245,15 +294,13 @@ class JobInfo:
     ended_at: Optional[str] = None
     result: Optional[dict[str, Any]] = None
     exc_info: Optional[str] = None
+    # Subtitle built from ``result`` on first access
+    _subtitle: Optional[Subtitle] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "JobInfo":
         """Create JobInfo from API response."""
-        status_str = data.get("status", "unknown")
-        try:
-            status = JobStatus(status_str)
-        except ValueError:
-            status = JobStatus.UNKNOWN
+        status = _JOB_STATUS_BY_VALUE.get(data.get("status"), JobStatus.UNKNOWN)
 
         return cls(
             job_id=data.get("job_id", ""),
@@ -281,13 +328,13 @@ class JobInfo:
 
     @property
     def subtitle(self) -> Optional[Subtitle]:
-        """Get Subtitle object if job completed successfully."""
-        if self.is_complete and self.result:
-            return Subtitle.from_dict(self.result)
-        return None
+        """Get Subtitle object if job completed successfully (built once, then reused)."""
+        if self._subtitle is None and self.is_complete and self.result:
+            self._subtitle = Subtitle.from_dict(self.result)
+        return self._subtitle
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchExtractionResult:
     """
     Result of a batch extraction request.
@@ -321,7 +368,7 @@ class BatchExtractionResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedResponse:
     """
     Response when a subtitle extraction is queued.
@@ -352,6 +399,21 @@ class QueuedResponse:
         )
 
 
+_ERROR_CODE_MAP: dict[str, type[YouTubeSubtitleAPIError]] = {
+    "RATE_LIMIT_EXCEEDED": RateLimitError,
+    "UNAUTHORIZED": AuthenticationError,
+    "SUBTITLE_NOT_FOUND": NotFoundError,
+    "INVALID_VIDEO_ID": ValidationError,
+    "INVALID_REQUEST": ValidationError,
+}
+
+_ERROR_STATUS_MAP: dict[int, type[YouTubeSubtitleAPIError]] = {
+    429: RateLimitError,
+    401: AuthenticationError,
+    404: NotFoundError,
+}
+
+
 def _parse_error_response(status_code: int, data: dict[str, Any]) -> YouTubeSubtitleAPIError:
     """
     Parse an API error response into an appropriate exception.
@@ -368,28 +430,180 @@ def _parse_error_response(status_code: int, data: dict[str, Any]) -> YouTubeSubt
     message = error.get("message", "")
     hint = error.get("hint", "")
 
-    # Map error codes to exceptions
-    if error_code == "RATE_LIMIT_EXCEEDED" or status_code == 429:
-        return RateLimitError(message=message, hint=hint)
-    if error_code == "UNAUTHORIZED" or status_code == 401:
-        return AuthenticationError(message=message, hint=hint)
-    if error_code == "SUBTITLE_NOT_FOUND" or status_code == 404:
-        return NotFoundError(message=message, hint=hint)
-    if error_code == "INVALID_VIDEO_ID" or error_code == "INVALID_REQUEST":
-        return ValidationError(message=message, hint=hint)
+    # Map error codes to exceptions, falling back to the HTTP status
+    cls = _ERROR_CODE_MAP.get(error_code) or _ERROR_STATUS_MAP.get(status_code)
+    if cls is RateLimitError:
+        retry_after = (error.get("meta") or {}).get("retry_after")
+        return RateLimitError(message=message, hint=hint, retry_after=retry_after)
+    if cls is not None:
+        return cls(message=message, hint=hint)
 
     # Generic API error
     return APIError(message=message or f"HTTP {status_code}", status_code=status_code)
 
 
+class _RateLimiter:
+    """
+    Spaces calls to ``acquire()`` at least ``1 / rate`` seconds apart.
+
+    Callers are released one at a time in arrival order, so a burst of
+    tasks is smoothed into a steady request rate.
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._interval = 1.0 / rate
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self._interval
+
+
+class _AdmissionControl:
+    """
+    Concurrency limit that adapts to rate limiting.
+
+    Works like a semaphore of size ``limit``, but the limit is halved
+    each time a request inside it fails with ``RateLimitError`` and grows
+    back by one per successful request, up to the original size. An
+    in-flight counter guarded by a condition makes resizing safe while
+    tasks are waiting.
+    """
+
+    def __init__(self, limit: int):
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self._max_limit = limit
+        self._limit = limit
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            if exc_type is None:
+                self._limit = min(self._max_limit, self._limit + 1)
+            elif issubclass(exc_type, RateLimitError):
+                self._limit = max(1, self._limit // 2)
+            self._cond.notify_all()
+
+
 class _BaseClient:
     """
     Base client with shared HTTP functionality.
     """
 
-    def __init__(self, config: Config):
+    def __init__(
+        self, config: Config, cache: Union[InMemoryCache, bool, None] = None
+    ):
         self.config = config
         self._base_url = config.base_url.rstrip("/")
+        # Fixed endpoints are parsed once; job URLs only append the job ID
+        self._url_subtitles = httpx.URL(f"{self._base_url}/api/v1/subtitles")
+        self._url_batch = httpx.URL(f"{self._base_url}/api/v1/subtitles/batch")
+        self._url_health = httpx.URL(f"{self._base_url}/health")
+        self._url_job_base = f"{self._base_url}{_JOB_PATH}"
+        if cache is True:
+            cache = InMemoryCache(max_size=2000, ttl=3600.0)
+        elif cache is False:
+            cache = None
+        self._cache: Optional[InMemoryCache] = cache
+
+    @staticmethod
+    def _poll_delay(attempt: int, poll_interval: float, max_poll: float) -> float:
+        """
+        Delay before status poll ``attempt`` (0-based).
+
+        Grows by 1.5x per attempt up to ``max_poll`` with +/-20% jitter, so
+        short jobs are noticed quickly and many concurrent waiters don't
+        poll in lockstep.
+        """
+        return min(max_poll, poll_interval * 1.5**attempt) * random.uniform(0.8, 1.2)
+
+    def _retry_delay(self, method: str, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Delay before retrying a failed request, or None to give up.
+
+        Only GET requests are retried, on dropped connections, read
+        timeouts, 502/503/504 and rate limiting (honouring ``retry_after``).
+        Delays double from 0.1s up to 5s. Failures to connect are left to
+        the transport, which already retries them for every method.
+        """
+        if method != "GET" or attempt >= self.config.max_retries:
+            return None
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return None
+        if isinstance(error, RateLimitError):
+            if error.retry_after:
+                return float(error.retry_after)
+        elif (
+            isinstance(error, YouTubeSubtitleAPIError)
+            and error.status_code not in _RETRYABLE_STATUS_CODES
+        ):
+            return None
+        return min(0.1 * 2**attempt, 5.0)
+
+    def _job_url(self, job_id: str) -> httpx.URL:
+        """URL of a job's status endpoint."""
+        return httpx.URL(self._url_job_base + job_id)
+
+    def _subtitles_url(self, video_id: str, language: str) -> httpx.URL:
+        """URL of a video's cached subtitles in the given language."""
+        return httpx.URL(
+            f"{self._url_subtitles}/{video_id}", params={"language": language}
+        )
+
+    def _job_wait_request(self, job_id: str, remaining: float) -> tuple[httpx.URL, float]:
+        """
+        Build the long-poll URL for a job and the HTTP timeout to use with it.
+
+        The HTTP timeout covers the server-side wait plus the normal
+        request budget, so a long-poll isn't cut off by the client timeout.
+        """
+        wait = min(remaining, _LONG_POLL_MAX_SECONDS)
+        url = httpx.URL(
+            f"{self._url_job_base}{job_id}/wait", params={"timeout": f"{wait:.1f}"}
+        )
+        return url, wait + self.config.timeout
+
+    def clear_cache(self) -> None:
+        """Drop all locally cached responses (no-op without a cache)."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self) -> Optional[dict[str, Any]]:
+        """
+        Describe the local response cache.
+
+        Returns:
+            Dict with ``size``, ``max_size`` and ``ttl``, or None if the
+            client was created without a cache
+        """
+        if self._cache is None:
+            return None
+        return {
+            "size": len(self._cache),
+            "max_size": self._cache.max_size,
+            "ttl": self._cache.ttl,
+        }
+
+    @staticmethod
+    def _cache_key(request: ExtractionRequest) -> tuple[str, str, bool]:
+        """Cache key for an extraction request."""
+        return (request.video_id, request.language, request.clean_for_ai)
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers."""
@@ -415,7 +629,7 @@ class _BaseClient:
             YouTubeSubtitleAPIError: For API errors
         """
         try:
-            data = response.json()
+            data = _json_loads(response.content)
         except Exception:
             data = {}
 
@@ -447,6 +661,7 @@ class YouTubeSubtitleAPI(_BaseClient):
         max_retries: int = 3,
         webhook_secret: Optional[str] = None,
         config: Optional[Config] = None,
+        cache: Union[InMemoryCache, bool, None] = None,
     ):
         """
         Initialize the client.
@@ -458,6 +673,8 @@ class YouTubeSubtitleAPI(_BaseClient):
             max_retries: Maximum retries for failed requests
             webhook_secret: Secret for webhook signature verification
             config: Pre-configured Config object (overrides other args)
+            cache: Optional cache for subtitle and finished-job responses;
+                pass True for a default InMemoryCache (2000 entries, 1 hour TTL)
         """
         if config:
             self.config = config
@@ -470,11 +687,20 @@ class YouTubeSubtitleAPI(_BaseClient):
                 webhook_secret=webhook_secret,
             )
 
-        super().__init__(self.config)
+        super().__init__(self.config, cache)
 
+        # Headers never change after construction; set them once on the
+        # client rather than merging a fresh dict into every request
         self._client = httpx.Client(
+            headers=self._get_headers(),
             timeout=self.config.timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            # Transport-level retries cover connection failures only;
+            # _request leaves those to it and retries everything else
+            transport=httpx.HTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=_CONNECTION_LIMITS,
+                retries=self.config.max_retries,
+            ),
         )
 
     def close(self) -> None:
@@ -490,28 +716,75 @@ class YouTubeSubtitleAPI(_BaseClient):
     def _request(
         self,
         method: str,
-        path: str,
+        url: httpx.URL,
         json_data: Optional[dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+        retry: bool = True,
     ) -> Any:
         """
         Make an HTTP request.
 
         Args:
             method: HTTP method
-            path: Request path (will be appended to base_url)
+            url: Request URL
             json_data: Optional JSON body
+            timeout: Per-request timeout overriding the client default
+            retry: Retry failed GETs; callers with their own retry loop
+                pass False
 
         Returns:
             Response JSON data
         """
-        url = f"{self._base_url}{path}"
-        response = self._client.request(
-            method=method,
-            url=url,
-            headers=self._get_headers(),
-            json=json_data,
-        )
-        return self._handle_response(response)
+        content = None if json_data is None else _json_dumps(json_data)
+        attempt = 0
+        while True:
+            try:
+                response = self._client.request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                )
+                return self._handle_response(response)
+            except (httpx.TransportError, YouTubeSubtitleAPIError) as e:
+                delay = self._retry_delay(method, attempt, e) if retry else None
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _stream_json(self, url: httpx.URL) -> Any:
+        """
+        Make a streaming GET request and decode the JSON body.
+
+        The body is collected into a single buffer as it arrives and
+        decoded once, rather than buffered by httpx and then parsed.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Response JSON data
+        """
+        attempt = 0
+        while True:
+            # Retried like any other GET; a retry restarts the download
+            try:
+                with self._client.stream("GET", url) as response:
+                    if response.status_code >= 400:
+                        response.read()
+                        return self._handle_response(response)
+                    body = bytearray()
+                    for chunk in response.iter_bytes():
+                        body += chunk
+                return _json_loads(body)
+            except (httpx.TransportError, YouTubeSubtitleAPIError) as e:
+                delay = self._retry_delay("GET", attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
 
     def extract_subtitles(
         self,
@@ -560,9 +833,15 @@ class YouTubeSubtitleAPI(_BaseClient):
             webhook_url=webhook_url,
         )
 
+        if self._cache is not None:
+            cache_key = self._cache_key(request)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         response = self._request(
             "POST",
-            "/api/v1/subtitles",
+            self._url_subtitles,
             json_data=request.to_dict(),
         )
 
@@ -571,13 +850,17 @@ class YouTubeSubtitleAPI(_BaseClient):
             return QueuedResponse.from_dict(response)
 
         # Return subtitle if cached
-        return Subtitle.from_dict(response)
+        subtitle = Subtitle.from_dict(response)
+        if self._cache is not None:
+            self._cache.set(cache_key, subtitle)
+        return subtitle
 
     def get_subtitles(
         self,
         video_id: str,
         *,
         language: str = "en",
+        stream: bool = False,
     ) -> Subtitle:
         """
         Get cached subtitles for a video.
@@ -588,6 +871,8 @@ class YouTubeSubtitleAPI(_BaseClient):
         Args:
             video_id: YouTube video ID
             language: Subtitle language code
+            stream: Stream the response body (lower peak memory for
+                multi-megabyte subtitles of long videos)
 
         Returns:
             Subtitle object
@@ -606,12 +891,22 @@ class YouTubeSubtitleAPI(_BaseClient):
         """
         video_id = extract_video_id(video_id)
 
-        response = self._request(
-            "GET",
-            f"/api/v1/subtitles/{video_id}",
-        )
+        cache_key = ("subtitles", video_id, language)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        url = self._subtitles_url(video_id, language)
+        if stream:
+            response = self._stream_json(url)
+        else:
+            response = self._request("GET", url)
 
-        return Subtitle.from_dict(response)
+        subtitle = Subtitle.from_dict(response)
+        if self._cache is not None:
+            self._cache.set(cache_key, subtitle)
+        return subtitle
 
     def extract_batch(
         self,
@@ -656,7 +951,7 @@ class YouTubeSubtitleAPI(_BaseClient):
 
         response = self._request(
             "POST",
-            "/api/v1/subtitles/batch",
+            self._url_batch,
             json_data=request.to_dict(),
         )
 
@@ -679,29 +974,41 @@ class YouTubeSubtitleAPI(_BaseClient):
             >>> elif job.is_failed:
             ...     print(f"Failed: {job.exc_info}")
         """
-        response = self._request(
-            "GET",
-            f"/api/v1/job/{job_id}",
-        )
+        cache_key = ("job", job_id)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        return JobInfo.from_dict(response)
+        response = self._request("GET", self._job_url(job_id))
+
+        job = JobInfo.from_dict(response)
+        # Finished and failed jobs never change again
+        if self._cache is not None and (job.is_complete or job.is_failed):
+            self._cache.set(cache_key, job)
+        return job
 
     def wait_for_job(
         self,
         job_id: str,
         *,
         timeout: float = 60.0,
-        poll_interval: float = 2.0,
+        poll_interval: float = 0.25,
+        max_poll: float = 10.0,
     ) -> Subtitle:
         """
         Wait for a job to complete and return the subtitle.
 
-        Polls the job status until completion or timeout.
+        Long-polls the job endpoint so the server answers as soon as the
+        job finishes. Against servers without long-poll support it falls back
+        to polling, starting at ``poll_interval`` and backing off to
+        ``max_poll`` seconds.
 
         Args:
             job_id: Job identifier
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between polls in seconds
+            poll_interval: Initial delay between polls in seconds (fallback mode)
+            max_poll: Maximum delay between polls in seconds (fallback mode)
 
         Returns:
             Subtitle object when job completes
@@ -714,18 +1021,44 @@ class YouTubeSubtitleAPI(_BaseClient):
             >>> subtitle = client.wait_for_job(job_id, timeout=120)
             >>> print(subtitle.plain_text)
         """
-        import time
-
-        start_time = time.time()
+        monotonic = time.monotonic
+        sleep = time.sleep
+        deadline = monotonic() + timeout
+        long_poll = True
+        attempt = 0
+        failures = 0
 
         while True:
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
                 raise TimeoutError(
                     f"Job {job_id} did not complete within {timeout} seconds"
                 )
 
-            job = self.get_job_status(job_id)
+            if long_poll:
+                url, request_timeout = self._job_wait_request(job_id, remaining)
+                try:
+                    job = JobInfo.from_dict(
+                        self._request(
+                            "GET", url, timeout=request_timeout, retry=False
+                        )
+                    )
+                except (NotFoundError, ValidationError):
+                    # Server predates the /wait endpoint
+                    long_poll = False
+                    continue
+                except (httpx.TransportError, YouTubeSubtitleAPIError) as e:
+                    # Retried here rather than in _request so each attempt
+                    # asks the server to hold only for the time still left
+                    delay = self._retry_delay("GET", failures, e)
+                    if delay is None or delay >= deadline - monotonic():
+                        raise
+                    failures += 1
+                    sleep(delay)
+                    continue
+                failures = 0
+            else:
+                job = self.get_job_status(job_id)
 
             if job.is_complete:
                 if job.subtitle:
@@ -737,8 +1070,13 @@ class YouTubeSubtitleAPI(_BaseClient):
                     f"Job {job_id} failed: {job.exc_info or 'Unknown error'}"
                 )
 
-            # Wait before next poll
-            time.sleep(poll_interval)
+            # A long-poll only holds pending jobs; anything else it answers at
+            # once (unknown jobs, or finished before the result is stored),
+            # so pace those like regular polls
+            if not long_poll or not job.is_pending:
+                delay = self._poll_delay(attempt, poll_interval, max_poll)
+                attempt += 1
+                sleep(min(delay, max(0.0, deadline - monotonic())))
 
     def health(self) -> dict[str, Any]:
         """
@@ -751,7 +1089,7 @@ class YouTubeSubtitleAPI(_BaseClient):
             >>> health = client.health()
             >>> print(f"Status: {health['status']}")
         """
-        return self._request("GET", "/health")
+        return self._request("GET", self._url_health)
 
 
 class AsyncYouTubeSubtitleAPI(_BaseClient):
@@ -777,6 +1115,7 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
         max_retries: int = 3,
         webhook_secret: Optional[str] = None,
         config: Optional[Config] = None,
+        cache: Union[InMemoryCache, bool, None] = None,
     ):
         """
         Initialize the async client.
@@ -788,6 +1127,8 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
             max_retries: Maximum retries for failed requests
             webhook_secret: Secret for webhook signature verification
             config: Pre-configured Config object (overrides other args)
+            cache: Optional cache for subtitle and finished-job responses;
+                pass True for a default InMemoryCache (2000 entries, 1 hour TTL)
         """
         if config:
             self.config = config
@@ -800,11 +1141,23 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
                 webhook_secret=webhook_secret,
             )
 
-        super().__init__(self.config)
+        super().__init__(self.config, cache)
 
+        # In-flight extract_subtitles() calls, for single-flight sharing
+        self._inflight: dict[tuple[str, str, bool], asyncio.Future] = {}
+
+        # Headers never change after construction; set them once on the
+        # client rather than merging a fresh dict into every request
         self._client = httpx.AsyncClient(
+            headers=self._get_headers(),
             timeout=self.config.timeout,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            # Transport-level retries cover connection failures only;
+            # _request leaves those to it and retries everything else
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=_CONNECTION_LIMITS,
+                retries=self.config.max_retries,
+            ),
         )
 
     async def close(self) -> None:
@@ -820,28 +1173,72 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
     async def _request(
         self,
         method: str,
-        path: str,
+        url: httpx.URL,
         json_data: Optional[dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+        retry: bool = True,
     ) -> Any:
         """
         Make an async HTTP request.
 
         Args:
             method: HTTP method
-            path: Request path (will be appended to base_url)
+            url: Request URL
             json_data: Optional JSON body
+            timeout: Per-request timeout overriding the client default
+            retry: Retry failed GETs; callers with their own retry loop
+                pass False
 
         Returns:
             Response JSON data
         """
-        url = f"{self._base_url}{path}"
-        response = await self._client.request(
-            method=method,
-            url=url,
-            headers=self._get_headers(),
-            json=json_data,
-        )
-        return self._handle_response(response)
+        content = None if json_data is None else _json_dumps(json_data)
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                )
+                return self._handle_response(response)
+            except (httpx.TransportError, YouTubeSubtitleAPIError) as e:
+                delay = self._retry_delay(method, attempt, e) if retry else None
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _stream_json(self, url: httpx.URL) -> Any:
+        """
+        Make a streaming async GET request and decode the JSON body.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Response JSON data
+        """
+        attempt = 0
+        while True:
+            # Retried like any other GET; a retry restarts the download
+            try:
+                async with self._client.stream("GET", url) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        return self._handle_response(response)
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                return _json_loads(body)
+            except (httpx.TransportError, YouTubeSubtitleAPIError) as e:
+                delay = self._retry_delay("GET", attempt, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
 
     async def extract_subtitles(
         self,
@@ -867,6 +1264,9 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
 
         Returns:
             Subtitle object if cached, QueuedResponse if queued
+
+        Concurrent calls for the same video, language and ``clean_for_ai``
+        (without a webhook) share a single API request.
         """
         request = ExtractionRequest(
             video_id=video_id,
@@ -876,22 +1276,53 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
             webhook_url=webhook_url,
         )
 
+        if self._cache is not None:
+            cached = self._cache.get(self._cache_key(request))
+            if cached is not None:
+                return cached
+
+        # Each webhook request must reach the API so its webhook fires
+        if request.webhook_url is not None:
+            return await self._extract(request)
+
+        key = self._cache_key(request)
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._extract(request))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda task: self._forget_inflight(key, task))
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(pending)
+
+    def _forget_inflight(self, key: tuple[str, str, bool], task: asyncio.Future) -> None:
+        """Drop a finished single-flight request."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller was cancelled
+            task.exception()
+
+    async def _extract(self, request: ExtractionRequest) -> Union[Subtitle, QueuedResponse]:
+        """POST an extraction request and cache a returned subtitle."""
         response = await self._request(
             "POST",
-            "/api/v1/subtitles",
+            self._url_subtitles,
             json_data=request.to_dict(),
         )
 
         if "job_id" in response:
             return QueuedResponse.from_dict(response)
 
-        return Subtitle.from_dict(response)
+        subtitle = Subtitle.from_dict(response)
+        if self._cache is not None:
+            self._cache.set(self._cache_key(request), subtitle)
+        return subtitle
 
     async def get_subtitles(
         self,
         video_id: str,
         *,
         language: str = "en",
+        stream: bool = False,
     ) -> Subtitle:
         """
         Get cached subtitles for a video (async).
@@ -899,18 +1330,30 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
         Args:
             video_id: YouTube video ID
             language: Subtitle language code
+            stream: Stream the response body (lower peak memory for
+                multi-megabyte subtitles of long videos)
 
         Returns:
             Subtitle object
         """
         video_id = extract_video_id(video_id)
 
-        response = await self._request(
-            "GET",
-            f"/api/v1/subtitles/{video_id}",
-        )
+        cache_key = ("subtitles", video_id, language)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        url = self._subtitles_url(video_id, language)
+        if stream:
+            response = await self._stream_json(url)
+        else:
+            response = await self._request("GET", url)
 
-        return Subtitle.from_dict(response)
+        subtitle = Subtitle.from_dict(response)
+        if self._cache is not None:
+            self._cache.set(cache_key, subtitle)
+        return subtitle
 
     async def extract_batch(
         self,
@@ -941,7 +1384,7 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
 
         response = await self._request(
             "POST",
-            "/api/v1/subtitles/batch",
+            self._url_batch,
             json_data=request.to_dict(),
         )
 
@@ -957,43 +1400,82 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
         Returns:
             JobInfo object with status and result
         """
-        response = await self._request(
-            "GET",
-            f"/api/v1/job/{job_id}",
-        )
+        cache_key = ("job", job_id)
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        return JobInfo.from_dict(response)
+        response = await self._request("GET", self._job_url(job_id))
+
+        job = JobInfo.from_dict(response)
+        # Finished and failed jobs never change again
+        if self._cache is not None and (job.is_complete or job.is_failed):
+            self._cache.set(cache_key, job)
+        return job
 
     async def wait_for_job(
         self,
         job_id: str,
         *,
         timeout: float = 60.0,
-        poll_interval: float = 2.0,
+        poll_interval: float = 0.25,
+        max_poll: float = 10.0,
     ) -> Subtitle:
         """
         Wait for a job to complete and return the subtitle (async).
 
+        Long-polls the job endpoint, falling back to polling with backoff
+        (``poll_interval`` up to ``max_poll`` seconds) against servers
+        without long-poll support.
+
         Args:
             job_id: Job identifier
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between polls in seconds
+            poll_interval: Initial delay between polls in seconds (fallback mode)
+            max_poll: Maximum delay between polls in seconds (fallback mode)
 
         Returns:
             Subtitle object when job completes
         """
-        import asyncio
-
-        start_time = asyncio.get_event_loop().time()
+        loop_time = asyncio.get_running_loop().time
+        sleep = asyncio.sleep
+        deadline = loop_time() + timeout
+        long_poll = True
+        attempt = 0
+        failures = 0
 
         while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
+            remaining = deadline - loop_time()
+            if remaining <= 0:
                 raise TimeoutError(
                     f"Job {job_id} did not complete within {timeout} seconds"
                 )
 
-            job = await self.get_job_status(job_id)
+            if long_poll:
+                url, request_timeout = self._job_wait_request(job_id, remaining)
+                try:
+                    job = JobInfo.from_dict(
+                        await self._request(
+                            "GET", url, timeout=request_timeout, retry=False
+                        )
+                    )
+                except (NotFoundError, ValidationError):
+                    # Server predates the /wait endpoint
+                    long_poll = False
+                    continue
+                except (httpx.TransportError, YouTubeSubtitleAPIError) as e:
+                    # Retried here rather than in _request so each attempt
+                    # asks the server to hold only for the time still left
+                    delay = self._retry_delay("GET", failures, e)
+                    if delay is None or delay >= deadline - loop_time():
+                        raise
+                    failures += 1
+                    await sleep(delay)
+                    continue
+                failures = 0
+            else:
+                job = await self.get_job_status(job_id)
 
             if job.is_complete:
                 if job.subtitle:
@@ -1005,7 +1487,13 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
                     f"Job {job_id} failed: {job.exc_info or 'Unknown error'}"
                 )
 
-            await asyncio.sleep(poll_interval)
+            # A long-poll only holds pending jobs; anything else it answers at
+            # once (unknown jobs, or finished before the result is stored),
+            # so pace those like regular polls
+            if not long_poll or not job.is_pending:
+                delay = self._poll_delay(attempt, poll_interval, max_poll)
+                attempt += 1
+                await sleep(min(delay, max(0.0, deadline - loop_time())))
 
     async def health(self) -> dict[str, Any]:
         """
@@ -1014,7 +1502,7 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
         Returns:
             Health check response with component status
         """
-        return await self._request("GET", "/health")
+        return await self._request("GET", self._url_health)
 
     async def extract_subtitles_batch_parallel(
         self,
@@ -1023,39 +1511,224 @@ class AsyncYouTubeSubtitleAPI(_BaseClient):
         language: str = "en",
         clean_for_ai: bool = True,
         concurrency: int = 5,
+        rps: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        batch_size: int = _BATCH_MAX_VIDEOS,
     ) -> list[tuple[str, Union[Subtitle, QueuedResponse, Exception]]]:
         """
         Extract subtitles for multiple videos in parallel.
 
-        This method makes concurrent requests for better performance.
+        Videos are submitted through the batch endpoint, ``batch_size``
+        (at most 100) per request, so N videos cost N / batch_size POSTs
+        rather than N; batches are sent concurrently. Against servers
+        without the batch endpoint, videos are extracted one by one.
+        Videos the server already has cached are then fetched concurrently;
+        the rest are returned as ``QueuedResponse`` objects. Requests that
+        hit the rate limit or a 502/503/504 are retried with jittered
+        exponential backoff (honouring ``retry_after`` when the API provides
+        it), and each rate limit halves the number of concurrent requests
+        until later requests succeed. Malformed video IDs are reported as
+        ``InvalidVideoIDError`` results without making a request.
+
+        Use iter_extract_subtitles_batch() to handle results as they arrive.
 
         Args:
             video_ids: List of YouTube video IDs
             language: Subtitle language code
             clean_for_ai: Normalize text for AI consumption
             concurrency: Maximum concurrent requests
+            rps: Optional cap on requests started per second
+            max_retries: Retries per request after a rate limit or gateway
+                error (defaults to ``config.max_retries``)
+            batch_size: Videos per batch request (1-100)
 
         Returns:
-            List of (video_id, result) tuples
+            List of (video_id, result) tuples, in input order
         """
-        import asyncio
+        results = {
+            vid: result
+            async for vid, result in self.iter_extract_subtitles_batch(
+                video_ids,
+                language=language,
+                clean_for_ai=clean_for_ai,
+                concurrency=concurrency,
+                rps=rps,
+                max_retries=max_retries,
+                batch_size=batch_size,
+            )
+        }
+        return [(vid, results[vid]) for vid in video_ids]
 
-        async def extract_one(vid: str) -> tuple[str, Union[Subtitle, QueuedResponse, Exception]]:
+    async def iter_extract_subtitles_batch(
+        self,
+        video_ids: list[str],
+        *,
+        language: str = "en",
+        clean_for_ai: bool = True,
+        concurrency: int = 5,
+        rps: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        batch_size: int = _BATCH_MAX_VIDEOS,
+    ) -> AsyncIterator[tuple[str, Union[Subtitle, QueuedResponse, Exception]]]:
+        """
+        Extract subtitles for multiple videos, yielding results as they arrive.
+
+        Works like extract_subtitles_batch_parallel(), but yields one
+        ``(video_id, result)`` tuple per distinct video ID in completion
+        order, so callers can start on early results while slower requests
+        are still in flight.
+
+        Example:
+            >>> async for video_id, result in client.iter_extract_subtitles_batch(ids):
+            ...     if isinstance(result, Subtitle):
+            ...         save(video_id, result.to_srt())
+        """
+        if not 1 <= batch_size <= _BATCH_MAX_VIDEOS:
+            raise ValueError(f"batch_size must be between 1 and {_BATCH_MAX_VIDEOS}")
+        if max_retries is None:
+            max_retries = self.config.max_retries
+
+        admission = _AdmissionControl(concurrency)
+        limiter = _RateLimiter(rps) if rps else None
+        finished: asyncio.Queue[
+            tuple[str, Union[Subtitle, QueuedResponse, Exception]]
+        ] = asyncio.Queue()
+        # Pending videos without a queue entry yet; the consumer waits for
+        # exactly one per video, so later reports for a video are dropped
+        unreported: set[str] = set()
+
+        def report(
+            vid: str, result: Union[Subtitle, QueuedResponse, Exception]
+        ) -> None:
+            if vid in unreported:
+                unreported.remove(vid)
+                finished.put_nowait((vid, result))
+
+        async def call(make_request: Callable[[], Awaitable[Any]]) -> Any:
+            attempt = 0
+            while True:
+                try:
+                    async with admission:
+                        if limiter is not None:
+                            await limiter.acquire()
+                        return await make_request()
+                except YouTubeSubtitleAPIError as e:
+                    retryable = (
+                        isinstance(e, RateLimitError)
+                        or e.status_code in _RETRYABLE_STATUS_CODES
+                    )
+                    if not retryable or attempt >= max_retries:
+                        raise
+                    delay = getattr(e, "retry_after", None) or min(
+                        _BATCH_RETRY_MAX_DELAY, _BATCH_RETRY_BASE_DELAY * 2**attempt
+                    ) * random.uniform(0.5, 1.0)
+                    # Sleep outside the admission slot so other requests keep going
+                    await asyncio.sleep(delay)
+                    attempt += 1
+
+        async def extract_single(vid: str) -> None:
             try:
-                result = await self.extract_subtitles(
-                    video_id=vid,
-                    language=language,
-                    clean_for_ai=clean_for_ai,
+                result = await call(
+                    lambda: self.extract_subtitles(
+                        video_id=vid, language=language, clean_for_ai=clean_for_ai
+                    )
                 )
-                return (vid, result)
             except Exception as e:
-                return (vid, e)
+                result = e
+            report(vid, result)
 
-        semaphore = asyncio.Semaphore(concurrency)
+        async def fetch_cached(vid: str) -> None:
+            try:
+                # call() owns the retries, so back-off sleeps happen outside
+                # the admission slot and rate limits reach the admission control
+                response = await call(
+                    lambda: self._request(
+                        "GET", self._subtitles_url(vid, language), retry=False
+                    )
+                )
+                result = Subtitle.from_dict(response)
+                if self._cache is not None:
+                    # Same key as get_subtitles(): like the server's GET lookup it
+                    # ignores clean_for_ai, so this must not be stored as an
+                    # extract_subtitles() result for this clean_for_ai setting
+                    self._cache.set(("subtitles", vid, language), result)
+            except NotFoundError:
+                # Evicted between the batch lookup and this fetch
+                await extract_single(vid)
+                return
+            except Exception as e:
+                result = e
+            report(vid, result)
 
-        async def bounded_extract(vid: str) -> tuple[str, Union[Subtitle, QueuedResponse, Exception]]:
-            async with semaphore:
-                return await extract_one(vid)
+        async def submit(chunk: list[str]) -> None:
+            try:
+                await submit_chunk(chunk)
+            except Exception as e:
+                # Whatever went wrong, every video still gets its entry
+                for vid in chunk:
+                    report(vid, e)
 
-        tasks = [bounded_extract(vid) for vid in video_ids]
-        return await asyncio.gather(*tasks)
+        async def submit_chunk(chunk: list[str]) -> None:
+            try:
+                batch = await call(
+                    lambda: self.extract_batch(
+                        chunk, language=language, clean_for_ai=clean_for_ai
+                    )
+                )
+            except NotFoundError:
+                # Server without the batch endpoint
+                await asyncio.gather(*(extract_single(vid) for vid in chunk))
+                return
+
+            # The server queues uncached videos in request order
+            cached = set(batch.cached)
+            job_ids = iter(batch.job_ids)
+            for vid in chunk:
+                if vid in cached:
+                    continue
+                job_id = next(job_ids, None)
+                if job_id is None:
+                    report(vid, APIError("Batch response did not include this video"))
+                else:
+                    report(vid, QueuedResponse(
+                        job_id=job_id, status="queued", video_id=vid, language=language
+                    ))
+            await asyncio.gather(*(fetch_cached(vid) for vid in chunk if vid in cached))
+
+        # Reject bad IDs and serve local cache hits before any request
+        seen: set[str] = set()
+        ready: list[tuple[str, Union[Subtitle, QueuedResponse, Exception]]] = []
+        pending: list[str] = []
+        for vid in video_ids:
+            if vid in seen:
+                continue
+            seen.add(vid)
+            if not _is_valid_video_id(vid):
+                ready.append((vid, InvalidVideoIDError(video_id=vid)))
+                continue
+            if self._cache is not None:
+                hit = self._cache.get((vid, language, clean_for_ai))
+                if hit is not None:
+                    ready.append((vid, hit))
+                    continue
+            pending.append(vid)
+        unreported.update(pending)
+
+        runner = asyncio.gather(
+            *(
+                submit(pending[i : i + batch_size])
+                for i in range(0, len(pending), batch_size)
+            )
+        )
+        try:
+            for item in ready:
+                yield item
+            # Every pending video produces exactly one queue entry
+            for _ in range(len(pending)):
+                yield await finished.get()
+            await runner
+        finally:
+            if not runner.done():
+                # The caller stopped early; don't leave requests running
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
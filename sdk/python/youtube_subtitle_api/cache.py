@@ -0,0 +1,92 @@
+"""
+Client-side response caching for the YouTube Subtitle API SDK.
+
+This module provides a small in-memory cache that clients can use to
+avoid repeating API calls for subtitles they have already fetched.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class InMemoryCache:
+    """
+    Thread-safe LRU cache with per-entry expiry.
+
+    Entries expire ``ttl`` seconds after they are stored. When the cache
+    is full, the least recently used entry is evicted.
+
+    Example:
+        >>> cache = InMemoryCache(max_size=500, ttl=600)
+        >>> client = YouTubeSubtitleAPI(api_key="your-key", cache=cache)
+        >>> client.extract_subtitles("dQw4w9WgXcQ")  # API call
+        >>> client.extract_subtitles("dQw4w9WgXcQ")  # served from cache
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries to keep
+            ttl: Time-to-live for each entry in seconds
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
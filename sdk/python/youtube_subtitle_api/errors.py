@@ -45,16 +45,20 @@ class YouTubeSubtitleAPIError(Exception):
         self.status_code = status_code
         self.hint = hint
         self.error_code = error_code
-        super().__init__(self._format_message())
+        # The full text is built in __str__, only if the error is shown
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return self._format_message()
 
     def _format_message(self) -> str:
         """Format the full error message with hint."""
-        parts = [self.message]
+        message = self.message
         if self.hint:
-            parts.append(f"Hint: {self.hint}")
+            message = f"{message} | Hint: {self.hint}"
         if self.status_code:
-            parts.append(f"Status Code: {self.status_code}")
-        return " | ".join(parts)
+            message = f"{message} | Status Code: {self.status_code}"
+        return message
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -7,10 +7,38 @@ including subtitle items, job status enums, and webhook events.
 
 from __future__ import annotations
 
+import json
+import re
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from itertools import accumulate
+from typing import Any, Iterator, Optional, TextIO
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson ships with the [fastapi] extra
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Joins subtitle texts for whole-transcript search; never appears in captions
+_SEARCH_SEPARATOR = "\x00"
+
+
+def _format_timestamp(seconds: float) -> str:
+    """Format seconds as an SRT timestamp (HH:MM:SS,mmm)."""
+    # Integer math on rounded milliseconds, so 1.9999999 becomes 00:00:02,000
+    hours, rest = divmod(round(seconds * 1000), 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    secs, milliseconds = divmod(rest, 1000)
+    # %-formatting is markedly faster than an f-string with four format specs
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, milliseconds)
 
 
 class JobStatus(str, Enum):
@@ -42,13 +70,18 @@ class JobStatus(str, Enum):
         Returns:
             JobStatus enum value
         """
-        try:
-            return cls(value.lower())
-        except ValueError:
-            return cls.UNKNOWN
+        # API statuses are already lowercase; only lower() on a miss
+        status = _JOB_STATUS_BY_VALUE.get(value)
+        if status is None:
+            status = _JOB_STATUS_BY_VALUE.get(value.lower(), cls.UNKNOWN)
+        return status
 
 
-@dataclass(frozen=True)
+# Dict lookup instead of JobStatus(value), which raises on unknown values
+_JOB_STATUS_BY_VALUE = {status.value: status for status in JobStatus}
+
+
+@dataclass(frozen=True, slots=True)
 class SubtitleItem:
     """
     A single subtitle entry with timing information.
@@ -64,6 +97,9 @@ class SubtitleItem:
     start: float
     end: float
     dur: Optional[float] = None
+    # SRT timestamps, formatted on first use
+    _start_ts: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _end_ts: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Calculate duration if not provided."""
@@ -81,6 +117,14 @@ class SubtitleItem:
         Returns:
             SubtitleItem instance
         """
+        # Fast path for the API's {"text", "start", "duration"} items
+        try:
+            start = float(data["start"])
+            dur = float(data["duration"])
+            return cls(text=data["text"], start=start, end=start + dur, dur=dur)
+        except (KeyError, TypeError, ValueError):
+            pass
+
         # Handle different possible field names
         text = data.get("text", "")
         start = float(data.get("start", 0))
@@ -111,11 +155,11 @@ class SubtitleItem:
         Returns:
             Formatted timestamp string
         """
-        hours = int(self.start // 3600)
-        minutes = int((self.start % 3600) // 60)
-        seconds = int(self.start % 60)
-        milliseconds = int((self.start % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+        timestamp = self._start_ts
+        if timestamp is None:
+            timestamp = _format_timestamp(self.start)
+            object.__setattr__(self, "_start_ts", timestamp)
+        return timestamp
 
     @property
     def end_timestamp(self) -> str:
@@ -125,11 +169,11 @@ class SubtitleItem:
         Returns:
             Formatted timestamp string
         """
-        hours = int(self.end // 3600)
-        minutes = int((self.end % 3600) // 60)
-        seconds = int(self.end % 60)
-        milliseconds = int((self.end % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+        timestamp = self._end_ts
+        if timestamp is None:
+            timestamp = _format_timestamp(self.end)
+            object.__setattr__(self, "_end_ts", timestamp)
+        return timestamp
 
     def to_srt(self, index: int) -> str:
         """
@@ -144,7 +188,7 @@ class SubtitleItem:
         return f"{index}\n{self.start_timestamp} --> {self.end_timestamp}\n{self.text}\n"
 
 
-@dataclass
+@dataclass(slots=True)
 class Subtitle:
     """
     Complete subtitle data for a YouTube video.
@@ -176,11 +220,19 @@ class Subtitle:
     cache_tier: Optional[str] = None
     created_at: Optional[str] = None
     proxy_used: Optional[str] = None
+    # Lazily built lookup structures. Each holds a copy of the items (or the
+    # text) it was built from and is rebuilt when that no longer matches, so
+    # edits to the public subtitles list never serve stale results.
+    _start_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _search_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _word_count_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Calculate derived fields."""
         if self.subtitle_count == 0 and self.subtitles:
-            object.__setattr__(self, "subtitle_count", len(self.subtitles))
+            self.subtitle_count = len(self.subtitles)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Subtitle":
@@ -193,11 +245,16 @@ class Subtitle:
         Returns:
             Subtitle instance
         """
-        subtitles_data = data.get("subtitles", [])
-        subtitles = [
-            SubtitleItem.from_dict(item) if isinstance(item, dict) else item
-            for item in subtitles_data
-        ]
+        subtitles_data = data.get("subtitles") or []
+        item_from_dict = SubtitleItem.from_dict
+        if isinstance(subtitles_data[0] if subtitles_data else None, dict):
+            # Decoded JSON: every item is a dict, so skip the per-item check
+            subtitles = [item_from_dict(item) for item in subtitles_data]
+        else:
+            subtitles = [
+                item_from_dict(item) if isinstance(item, dict) else item
+                for item in subtitles_data
+            ]
 
         return cls(
             video_id=data.get("video_id", ""),
@@ -214,6 +271,21 @@ class Subtitle:
             proxy_used=data.get("proxy_used"),
         )
 
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> "Subtitle":
+        """
+        Create Subtitle from a raw JSON API response body.
+
+        Decodes with orjson when it is installed.
+
+        Args:
+            raw: JSON document as bytes or str
+
+        Returns:
+            Subtitle instance
+        """
+        return cls.from_dict(_json_loads(raw))
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert to dictionary.
@@ -228,7 +300,10 @@ class Subtitle:
             "extraction_method": self.extraction_method,
             "subtitle_count": self.subtitle_count,
             "duration_ms": self.duration_ms,
-            "subtitles": [s.to_dict() for s in self.subtitles],
+            "subtitles": [
+                {"text": s.text, "start": s.start, "end": s.end, "dur": s.dur}
+                for s in self.subtitles
+            ],
             "plain_text": self.plain_text,
             "cached": self.cached,
             "cache_tier": self.cache_tier,
@@ -236,6 +311,17 @@ class Subtitle:
             "proxy_used": self.proxy_used,
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize to compact JSON (the to_dict() layout).
+
+        Encodes with orjson when it is installed.
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return _json_dumps(self.to_dict())
+
     def to_srt(self) -> str:
         """
         Export subtitles in SRT format.
@@ -243,10 +329,35 @@ class Subtitle:
         Returns:
             SRT formatted string
         """
-        lines = []
+        return "".join(self.iter_srt())
+
+    def to_srt_stream(self, fp: TextIO) -> None:
+        """
+        Write subtitles in SRT format to an open text file.
+
+        Args:
+            fp: Writable text stream (file, StringIO, ...)
+
+        Example:
+            >>> with open("subtitles.srt", "w") as f:
+            ...     subtitle.to_srt_stream(f)
+        """
+        fp.writelines(self.iter_srt())
+
+    def iter_srt(self) -> Iterator[str]:
+        """
+        Yield the SRT export one entry at a time.
+
+        Lets callers forward entries to a socket or response body without
+        building the whole document first.
+
+        Yields:
+            SRT entries; concatenated they equal to_srt()
+        """
+        separator = ""
         for i, item in enumerate(self.subtitles, start=1):
-            lines.append(item.to_srt(i))
-        return "\n".join(lines)
+            yield f"{separator}{i}\n{item.start_timestamp} --> {item.end_timestamp}\n{item.text}\n"
+            separator = "\n"
 
     def to_vtt(self) -> str:
         """
@@ -255,10 +366,55 @@ class Subtitle:
         Returns:
             WebVTT formatted string
         """
-        lines = ["WEBVTT\n"]
+        return "".join(self.iter_vtt())
+
+    def to_vtt_stream(self, fp: TextIO) -> None:
+        """
+        Write subtitles in WebVTT format to an open text file.
+
+        Args:
+            fp: Writable text stream (file, StringIO, ...)
+        """
+        fp.writelines(self.iter_vtt())
+
+    def iter_vtt(self) -> Iterator[str]:
+        """
+        Yield the WebVTT export one cue at a time, after the header.
+
+        Yields:
+            WebVTT chunks; concatenated they equal to_vtt()
+        """
+        yield "WEBVTT\n"
         for item in self.subtitles:
-            lines.append(f"\n{item.start_timestamp} --> {item.end_timestamp}\n{item.text}\n")
-        return "".join(lines)
+            # WebVTT differs from SRT only in the millisecond separator
+            start = item.start_timestamp.replace(",", ".")
+            end = item.end_timestamp.replace(",", ".")
+            yield f"\n{start} --> {end}\n{item.text}\n"
+
+    def plain_text_prefix(self, limit: int) -> str:
+        """
+        Get at most ``limit`` characters of the transcript.
+
+        Uses ``plain_text`` when present; otherwise joins only as many
+        subtitle items as are needed to fill the prefix.
+
+        Args:
+            limit: Maximum number of characters to return
+
+        Returns:
+            Transcript prefix (empty if there is no text)
+        """
+        if self.plain_text is not None:
+            return self.plain_text[:limit]
+
+        parts = []
+        length = 0
+        for item in self.subtitles:
+            if length >= limit:
+                break
+            parts.append(item.text)
+            length += len(item.text) + 1
+        return " ".join(parts)[:limit]
 
     def get_text_by_time_range(
         self, start: float, end: Optional[float] = None
@@ -272,15 +428,42 @@ class Subtitle:
 
         Returns:
             List of subtitle items in the time range
+
+        Items from the API are ordered by start time and are located by
+        binary search; unordered lists fall back to a full scan.
         """
-        items = []
-        for item in self.subtitles:
-            if item.start >= start:
-                if end is None or item.start <= end:
-                    items.append(item)
-                else:
-                    break
-        return items
+        starts = self._start_times()
+        if starts is None:
+            # No early exit: a later item may still start inside the range
+            return [
+                item
+                for item in self.subtitles
+                if item.start >= start and (end is None or item.start <= end)
+            ]
+
+        lo = bisect_left(starts, start)
+        hi = len(starts) if end is None else bisect_right(starts, end, lo)
+        return self.subtitles[lo:hi]
+
+    def _start_times(self) -> Optional[array]:
+        """
+        Return item start times as a packed float array for bisection.
+
+        Returns None when items are not ordered by start time, in which
+        case callers fall back to a linear scan.
+        """
+        subtitles = self.subtitles
+        cached = self._start_cache
+        # Rebuilt whenever the items differ from the snapshot, as in _search_index
+        if cached is not None and cached[0] == subtitles:
+            return cached[1]
+
+        starts: Optional[array] = array("d", (item.start for item in subtitles))
+        if any(a > b for a, b in zip(starts, starts[1:])):
+            starts = None
+
+        self._start_cache = (list(subtitles), starts)
+        return starts
 
     def search_text(self, query: str, case_sensitive: bool = False) -> list[SubtitleItem]:
         """
@@ -293,16 +476,115 @@ class Subtitle:
         Returns:
             List of matching subtitle items
         """
+        if not query:
+            return list(self.subtitles)
+
         if not case_sensitive:
             query = query.lower()
 
+        if _SEARCH_SEPARATOR in query:
+            return [
+                item
+                for item in self.subtitles
+                if query in (item.text if case_sensitive else item.text.lower())
+            ]
+
+        haystack, offsets = self._search_index(case_sensitive)
+
+        # One C-level scan over the joined transcript; each hit is mapped back
+        # to its item and the scan resumes at the next item so every matching
+        # item is reported once.
         items = []
-        for item in self.subtitles:
-            text = item.text if case_sensitive else item.text.lower()
-            if query in text:
-                items.append(item)
+        pos = haystack.find(query)
+        while pos != -1:
+            index = bisect_right(offsets, pos) - 1
+            items.append(self.subtitles[index])
+            if index + 1 == len(offsets):
+                break
+            pos = haystack.find(query, offsets[index + 1])
         return items
 
+    def search_texts(
+        self, queries: list[str], case_sensitive: bool = False
+    ) -> dict[str, list[SubtitleItem]]:
+        """
+        Search for several queries in a single pass over the transcript.
+
+        Equivalent to calling search_text() once per query, but all queries
+        are matched by one compiled regex scan.
+
+        Args:
+            queries: Texts to search for
+            case_sensitive: Whether to use case-sensitive search
+
+        Returns:
+            Dict mapping each query to its matching subtitle items
+        """
+        results: dict[str, list[SubtitleItem]] = {}
+        queries_by_needle: dict[str, list[str]] = {}
+        for query in queries:
+            needle = query if case_sensitive else query.lower()
+            if not needle or _SEARCH_SEPARATOR in needle:
+                results[query] = self.search_text(query, case_sensitive)
+            else:
+                queries_by_needle.setdefault(needle, []).append(query)
+        if not queries_by_needle:
+            return results
+
+        haystack, offsets = self._search_index(case_sensitive)
+
+        # A zero-width lookahead reports every position where any query
+        # starts. Alternatives are tried longest first, and any other query
+        # starting at the same position is a prefix of the reported match.
+        needles = sorted(queries_by_needle, key=len, reverse=True)
+        pattern = re.compile("(?=(" + "|".join(map(re.escape, needles)) + "))")
+        prefixes = {
+            needle: [other for other in needles if needle.startswith(other)]
+            for needle in needles
+        }
+
+        hits: dict[str, list[int]] = {needle: [] for needle in needles}
+        for match in pattern.finditer(haystack):
+            index = bisect_right(offsets, match.start()) - 1
+            for needle in prefixes[match.group(1)]:
+                indices = hits[needle]
+                if not indices or indices[-1] != index:
+                    indices.append(index)
+
+        subtitles = self.subtitles
+        for needle, indices in hits.items():
+            for query in queries_by_needle[needle]:
+                results[query] = [subtitles[i] for i in indices]
+        return results
+
+    def _search_index(self, case_sensitive: bool) -> tuple[str, list[int]]:
+        """
+        Return the joined transcript and each item's start offset within it.
+
+        Built on first use and rebuilt whenever the items differ from the
+        snapshot it was built from, including in-place edits to the list.
+        """
+        subtitles = self.subtitles
+        cached = self._search_cache
+        # List equality checks identity first, so unchanged items compare cheaply
+        if cached is not None and cached[0] == case_sensitive and cached[1] == subtitles:
+            return cached[2], cached[3]
+
+        texts = [
+            item.text if case_sensitive else item.text.lower()
+            for item in subtitles
+        ]
+        # Item i starts after the previous texts and their separators
+        offsets = (
+            list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+            if texts
+            else []
+        )
+        haystack = _SEARCH_SEPARATOR.join(texts)
+
+        self._search_cache = (case_sensitive, list(subtitles), haystack, offsets)
+        return haystack, offsets
+
     @property
     def total_duration(self) -> float:
         """
@@ -320,15 +602,31 @@ class Subtitle:
         """
         Get total word count of the transcript.
 
+        Computed once and reused until ``plain_text`` or the subtitle
+        items change.
+
         Returns:
             Number of words
         """
-        if self.plain_text:
-            return len(self.plain_text.split())
-        return sum(len(item.text.split()) for item in self.subtitles)
+        # Counted from plain_text when present, else from the items
+        source = self.plain_text or self.subtitles
+        cached = self._word_count_cache
+        if cached is not None and cached[0] == source:
+            return cached[1]
+
+        if isinstance(source, str):
+            count = len(source.split())
+            snapshot = source
+        else:
+            # One split over the joined text instead of one per item
+            count = len(" ".join([item.text for item in source]).split())
+            snapshot = list(source)
 
+        self._word_count_cache = (snapshot, count)
+        return count
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class WebhookEvent:
     """
     Webhook event received from the API.
@@ -350,6 +648,8 @@ class WebhookEvent:
     result: Optional[dict[str, Any]] = None
     error: Optional[str] = None
     timestamp: Optional[str] = None
+    # Subtitle built from ``result`` on first access
+    _subtitle: Optional[Subtitle] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "WebhookEvent":
@@ -372,6 +672,21 @@ class WebhookEvent:
             timestamp=data.get("timestamp"),
         )
 
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> "WebhookEvent":
+        """
+        Create WebhookEvent from a raw JSON webhook body.
+
+        Decodes with orjson when it is installed.
+
+        Args:
+            raw: JSON document as bytes or str
+
+        Returns:
+            WebhookEvent instance
+        """
+        return cls.from_dict(_json_loads(raw))
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert to dictionary.
@@ -401,7 +716,7 @@ class WebhookEvent:
 
     @property
     def subtitle(self) -> Optional[Subtitle]:
-        """Get Subtitle object if job was successful."""
-        if self.is_success and self.result:
-            return Subtitle.from_dict(self.result)
-        return None
+        """Get Subtitle object if job was successful (built once, then reused)."""
+        if self._subtitle is None and self.is_success and self.result:
+            object.__setattr__(self, "_subtitle", Subtitle.from_dict(self.result))
+        return self._subtitle
@@ -7,13 +7,58 @@ and parsing webhook payloads.
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import hmac
 import json
+import re
+from functools import lru_cache
 from typing import Any, Optional
 
 from .models import WebhookEvent
 
+# "sha256=<hex>" or bare hex; anything else can never match a hexdigest
+_SIGNATURE_PATTERN = re.compile(r"(?:sha256=)?([0-9a-f]{64})")
+
+# Payloads larger than this are verified and parsed off the event loop
+_ASYNC_OFFLOAD_BYTES = 64 * 1024
+
+
+def _signature_hash(signature: str) -> Optional[str]:
+    """Return the hex digest from a signature header, or None if malformed."""
+    match = _SIGNATURE_PATTERN.fullmatch(signature)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=32)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """
+    Return a keyed HMAC-SHA256 object for the given secret.
+
+    Keying an HMAC hashes the ipad/opad blocks up front; callers
+    ``copy()`` the template instead of paying for that on every webhook.
+    The digest is named by string so CPython builds the OpenSSL-backed
+    HMAC even when ``hashlib.sha256`` is not the OpenSSL constructor.
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod="sha256")
+
+
+def _compute_signature(
+    template: hmac.HMAC,
+    payload: bytes | str,
+    timestamp: Optional[str] = None,
+) -> str:
+    """Compute the hex signature of ``payload[.timestamp]`` from a keyed template."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+
+    mac = template.copy()
+    mac.update(payload)
+    # The API signs: payload_json + "." + timestamp
+    if timestamp:
+        mac.update(b".")
+        mac.update(timestamp.encode("utf-8"))
+    return mac.hexdigest()
+
 
 def verify_signature(
     payload: bytes | str,
@@ -51,31 +96,12 @@ def verify_signature(
         ...     event = parse_webhook(payload)
         ...     return {"status": "received"}
     """
-    # Extract signature hash (remove "sha256=" prefix if present)
-    if signature.startswith("sha256="):
-        signature_hash = signature[7:]
-    else:
-        signature_hash = signature
+    # Extract signature hash; malformed headers are rejected before hashing
+    signature_hash = _signature_hash(signature)
+    if signature_hash is None:
+        return False
 
-    # Ensure payload is bytes for consistent hashing
-    if isinstance(payload, str):
-        payload_bytes = payload.encode("utf-8")
-    else:
-        payload_bytes = payload
-
-    # Create the message to sign
-    # The API signs: payload_json + "." + timestamp
-    if timestamp:
-        message = f"{payload_bytes.decode('utf-8')}.{timestamp}"
-    else:
-        message = payload_bytes.decode("utf-8")
-
-    # Compute expected signature
-    expected_hash = hmac.new(
-        secret.encode("utf-8"),
-        message.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    expected_hash = _compute_signature(_hmac_template(secret), payload, timestamp)
 
     # Use constant-time comparison to prevent timing attacks
     return hmac.compare_digest(signature_hash, expected_hash)
@@ -108,15 +134,10 @@ def parse_webhook(payload: bytes | str | dict[str, Any]) -> WebhookEvent:
     """
     # Parse JSON if needed
     if isinstance(payload, dict):
-        data = payload
-    elif isinstance(payload, bytes):
-        data = json.loads(payload.decode("utf-8"))
-    elif isinstance(payload, str):
-        data = json.loads(payload)
-    else:
-        raise ValueError(f"Invalid payload type: {type(payload)}")
-
-    return WebhookEvent.from_dict(data)
+        return WebhookEvent.from_dict(payload)
+    if isinstance(payload, (bytes, str)):
+        return WebhookEvent.from_json(payload)
+    raise ValueError(f"Invalid payload type: {type(payload)}")
 
 
 def verify_and_parse_webhook(
@@ -163,6 +184,54 @@ def verify_and_parse_webhook(
     return parse_webhook(payload)
 
 
+async def verify_and_parse_webhook_async(
+    payload: bytes | str,
+    signature: str,
+    secret: str,
+    timestamp: Optional[str] = None,
+) -> WebhookEvent:
+    """
+    Async variant of verify_and_parse_webhook() for event-loop handlers.
+
+    Payloads over 64 KiB are hashed and parsed in a worker thread so a
+    large webhook doesn't stall other requests on the loop; smaller ones
+    run inline, where a thread hop would cost more than the work.
+
+    Args:
+        payload: The raw webhook payload
+        signature: The X-Webhook-Signature header value
+        secret: Your webhook secret key
+        timestamp: Optional X-Webhook-Timestamp header value
+
+    Returns:
+        WebhookEvent object with the parsed data
+
+    Raises:
+        ValueError: If signature is invalid or payload cannot be parsed
+
+    Example:
+        >>> @app.post("/webhook")
+        >>> async def handle_webhook(request: Request):
+        ...     payload = await request.body()
+        ...     sig = request.headers.get("X-Webhook-Signature", "")
+        ...     ts = request.headers.get("X-Webhook-Timestamp", "")
+        ...
+        ...     try:
+        ...         event = await verify_and_parse_webhook_async(
+        ...             payload, sig, WEBHOOK_SECRET, ts
+        ...         )
+        ...     except ValueError:
+        ...         raise HTTPException(status_code=401, detail="Invalid signature")
+        ...
+        ...     return process_event(event)
+    """
+    if len(payload) > _ASYNC_OFFLOAD_BYTES:
+        return await asyncio.to_thread(
+            verify_and_parse_webhook, payload, signature, secret, timestamp
+        )
+    return verify_and_parse_webhook(payload, signature, secret, timestamp)
+
+
 def generate_signature(
     payload: dict[str, Any] | str,
     secret: str,
@@ -192,18 +261,7 @@ def generate_signature(
     else:
         payload_json = payload
 
-    if timestamp:
-        message = f"{payload_json}.{timestamp}"
-    else:
-        message = payload_json
-
-    signature_hash = hmac.new(
-        secret.encode("utf-8"),
-        message.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-
-    return signature_hash
+    return _compute_signature(_hmac_template(secret), payload_json, timestamp)
 
 
 class WebhookVerifier:
@@ -233,6 +291,7 @@ class WebhookVerifier:
         """
         self.secret = secret
         self.require_timestamp = require_timestamp
+        self._template = _hmac_template(secret)
 
     def verify(
         self,
@@ -254,7 +313,12 @@ class WebhookVerifier:
         if self.require_timestamp and not timestamp:
             return False
 
-        return verify_signature(payload, signature, self.secret, timestamp)
+        signature_hash = _signature_hash(signature)
+        if signature_hash is None:
+            return False
+
+        expected_hash = _compute_signature(self._template, payload, timestamp)
+        return hmac.compare_digest(signature_hash, expected_hash)
 
     def parse(self, payload: bytes | str | dict[str, Any]) -> WebhookEvent:
         """
@@ -2,16 +2,17 @@
 YouTube Subtitle API - FastAPI Application
 Dual-engine subtitle extraction with VTT cleaning for AI consumption.
 """
+import asyncio
 import os
 import re
 import time
-import hashlib
 from typing import Optional
 from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, field_validator
 from cachetools import TTLCache
 import structlog
@@ -47,12 +48,21 @@ MAX_CONCURRENT = int(os.getenv("MAX_CONCURRENT", "5"))
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "3600"))
 CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "500"))
 
+# Video ID in a YouTube URL (watch, /v/, youtu.be, embed and shorts forms)
+_VIDEO_ID_RE = re.compile(r"(?:v=|/v/|youtu\.be/|embed/|shorts/)([a-zA-Z0-9_-]{11})")
+_VIDEO_ID_VALIDATE_RE = re.compile(r"[a-zA-Z0-9_-]{11}")
+
+# Hosts accepted by SubtitleRequest.url, along with their subdomains
+_ALLOWED_HOSTS = ("youtube.com", "youtu.be", "youtube-nocookie.com")
+_ALLOWED_HOST_SUFFIXES = tuple(f".{host}" for host in _ALLOWED_HOSTS)
+
 # In-memory caches
 subtitle_cache: TTLCache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
 rate_limit_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
 
-# Concurrency tracking
-current_requests = 0
+# Bounds in-flight extractions; requests over the limit get a 503
+# rather than queueing behind slow yt-dlp fallbacks
+extraction_slots = asyncio.Semaphore(MAX_CONCURRENT)
 
 # Subtitle service instance
 subtitle_service: Optional[SubtitleService] = None
@@ -74,7 +84,8 @@ app = FastAPI(
     title="YouTube Subtitle API",
     description="Extract and clean YouTube subtitles for AI consumption",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -100,8 +111,7 @@ class SubtitleRequest(BaseModel):
     def validate_video_id(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        pattern = r"^[a-zA-Z0-9_-]{11}$"
-        if not re.match(pattern, v):
+        if not _VIDEO_ID_VALIDATE_RE.fullmatch(v):
             raise ValueError("Invalid video ID format. Must be 11 alphanumeric characters.")
         return v
 
@@ -110,8 +120,9 @@ class SubtitleRequest(BaseModel):
     def validate_url(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        valid_domains = ["youtube.com", "youtu.be", "youtube-nocookie.com", "www.youtube.com"]
-        if not any(domain in v for domain in valid_domains):
+        # Match the parsed host, not a substring: "youtube.com.evil.tld" is rejected
+        host = urlsplit(v if "//" in v else f"//{v}").hostname or ""
+        if host not in _ALLOWED_HOSTS and not host.endswith(_ALLOWED_HOST_SUFFIXES):
             raise ValueError("URL must be from youtube.com or youtu.be")
         return v
 
@@ -156,14 +167,14 @@ def get_client_ip(request: Request) -> str:
 
 def check_rate_limit(client_ip: str) -> bool:
     """Check if client is within rate limit."""
-    # Hash IP for privacy
-    ip_hash = hashlib.sha256(client_ip.encode()).hexdigest()[:16]
-    current_count = rate_limit_cache.get(ip_hash, 0)
+    # Keyed by the raw IP: the counters live only in this process's memory
+    # and are never logged, so hashing each request's IP bought nothing
+    current_count = rate_limit_cache.get(client_ip, 0)
 
     if current_count >= RATE_LIMIT_PER_MINUTE:
         return False
 
-    rate_limit_cache[ip_hash] = current_count + 1
+    rate_limit_cache[client_ip] = current_count + 1
     return True
 
 
@@ -178,16 +189,8 @@ def verify_api_key(request: Request) -> bool:
 
 def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from YouTube URL."""
-    patterns = [
-        r"(?:v=|/v/|youtu\.be/)([a-zA-Z0-9_-]{11})",
-        r"(?:embed/)([a-zA-Z0-9_-]{11})",
-        r"(?:shorts/)([a-zA-Z0-9_-]{11})"
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -234,7 +237,7 @@ async def extract_subtitles(request: Request, body: SubtitleRequest):
     1. First tries youtube-transcript-api (fast, reliable)
     2. Falls back to yt-dlp if primary fails
     """
-    global current_requests, cache_hits, cache_misses
+    global cache_hits, cache_misses
 
     # Verify API key
     if not verify_api_key(request):
@@ -249,7 +252,7 @@ async def extract_subtitles(request: Request, body: SubtitleRequest):
         )
 
     # Concurrency check
-    if current_requests >= MAX_CONCURRENT:
+    if extraction_slots.locked():
         raise HTTPException(
             status_code=503,
             detail="Service busy. Please retry in a few seconds."
@@ -287,62 +290,59 @@ async def extract_subtitles(request: Request, body: SubtitleRequest):
 
     cache_misses += 1
 
-    # Extract subtitles
-    current_requests += 1
-    start_time = time.time()
-
-    try:
-        result: SubtitleResult = await subtitle_service.extract(
-            video_id=video_id,
-            language=body.language,
-            clean_for_ai=body.clean_for_ai
-        )
-
-        duration_ms = int((time.time() - start_time) * 1000)
-
-        if not result.success:
-            logger.warning("extraction_failed",
-                          video_id=video_id,
-                          error=result.error,
-                          duration_ms=duration_ms)
-            raise HTTPException(status_code=404, detail=result.error)
-
-        # Cache the result
-        subtitle_cache[cache_key] = {
-            "title": result.title,
-            "subtitles": result.subtitles,
-            "plain_text": result.plain_text,
-            "method": result.extraction_method
-        }
-
-        logger.info("extraction_success",
-                   video_id=video_id,
-                   method=result.extraction_method,
-                   subtitle_count=len(result.subtitles),
-                   duration_ms=duration_ms)
-
-        return SubtitleResponse(
-            success=True,
-            video_id=video_id,
-            title=result.title,
-            language=body.language,
-            extraction_method=result.extraction_method,
-            subtitle_count=len(result.subtitles),
-            duration_ms=duration_ms,
-            cached=False,
-            subtitles=result.subtitles,
-            plain_text=result.plain_text,
-            proxy_used=result.proxy_used
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("extraction_error", video_id=video_id, error=str(e))
-        raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
-
-    finally:
-        current_requests -= 1
+    # Extract subtitles. Nothing since the locked() check awaits, so a slot is free here
+    async with extraction_slots:
+        start_time = time.time()
+
+        try:
+            result: SubtitleResult = await subtitle_service.extract(
+                video_id=video_id,
+                language=body.language,
+                clean_for_ai=body.clean_for_ai
+            )
+
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            if not result.success:
+                logger.warning("extraction_failed",
+                              video_id=video_id,
+                              error=result.error,
+                              duration_ms=duration_ms)
+                raise HTTPException(status_code=404, detail=result.error)
+
+            # Cache the result
+            subtitle_cache[cache_key] = {
+                "title": result.title,
+                "subtitles": result.subtitles,
+                "plain_text": result.plain_text,
+                "method": result.extraction_method
+            }
+
+            logger.info("extraction_success",
+                       video_id=video_id,
+                       method=result.extraction_method,
+                       subtitle_count=len(result.subtitles),
+                       duration_ms=duration_ms)
+
+            return SubtitleResponse(
+                success=True,
+                video_id=video_id,
+                title=result.title,
+                language=body.language,
+                extraction_method=result.extraction_method,
+                subtitle_count=len(result.subtitles),
+                duration_ms=duration_ms,
+                cached=False,
+                subtitles=result.subtitles,
+                plain_text=result.plain_text,
+                proxy_used=result.proxy_used
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("extraction_error", video_id=video_id, error=str(e))
+            raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
 
 
 @app.exception_handler(Exception)
@@ -351,7 +351,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     logger.error("unhandled_exception",
                 path=request.url.path,
                 error=str(exc))
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
@@ -8,7 +8,7 @@ import uuid
 from typing import Any, Optional
 
 from fastapi import Request, Response, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.routing import Match
 
@@ -66,39 +66,83 @@ ERROR_CODES = {
 class APIVersionMiddleware(BaseHTTPMiddleware):
     """
     Middleware to handle API versioning and backward compatibility.
-    Redirects /api/* to /api/v1/* with deprecation warning.
+
+    Legacy /api/* paths map onto /api/v1/*. With ``redirect=True`` (default)
+    clients get a 308 with a deprecation warning; otherwise the path is
+    rewritten in the ASGI scope before routing, so the routers only need to
+    be mounted once under /api/v1.
     """
 
+    def __init__(self, app, redirect: bool = True):
+        super().__init__(app)
+        self.redirect = redirect
+
     async def dispatch(self, request: Request, call_next):
-        # Only process API routes
-        if request.url.path.startswith("/api/") and not request.url.path.startswith(
-            "/api/v1/"
+        path = request.scope["path"]
+        # Only process unversioned API routes
+        if not path.startswith("/api/") or path.startswith("/api/v1/"):
+            return await call_next(request)
+
+        if path.startswith("/api/admin"):
+            # Admin routes go through /api/v1/admin/
+            new_path = path.replace("/api/admin", "/api/v1/admin", 1)
+        else:
+            # Subtitle routes go through /api/v1/subtitles
+            new_path = path.replace("/api/", "/api/v1/", 1)
+
+        if not self.redirect:
+            request.scope["path"] = new_path
+            request.scope["raw_path"] = new_path.encode("utf-8")
+            return await call_next(request)
+
+        # Return redirect with deprecation warning
+        return ORJSONResponse(
+            status_code=308,  # Permanent redirect
+            content={
+                "redirect": new_path,
+                "warning": "API path deprecated. Use /api/v1/ prefix instead.",
+            },
+            headers={
+                "Location": new_path,
+                "X-API-Deprecation": "true",
+            },
+        )
+
+
+class LivenessProbeMiddleware:
+    """
+    Pure ASGI fast path for the /live probe.
+
+    Kubernetes hits /live every few seconds per pod and the answer never
+    depends on request state, so it is served before the logging, rate
+    limiting and header middleware run. /health is deliberately not
+    short-circuited: it checks Redis/Postgres and must go through routing.
+    """
+
+    _BODY = b'{"status":"ok"}'
+
+    def __init__(self, app, path: str = "/live"):
+        self.app = app
+        self.path = path
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._BODY)).encode("latin-1")),
+            (b"x-api-version", settings.API_CURRENT_VERSION.encode("latin-1")),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] == self.path
+            and scope["method"] in ("GET", "HEAD")
         ):
-            # Check if this is a direct /api/ call (not /api/v1/)
-            if request.url.path.startswith("/api/admin"):
-                # Admin routes go through /api/v1/admin/
-                new_path = request.url.path.replace("/api/admin", "/api/v1/admin", 1)
-            else:
-                # Subtitle routes go through /api/v1/subtitles
-                new_path = request.url.path.replace("/api/", "/api/v1/", 1)
-
-            # Return redirect with deprecation warning
-            response = JSONResponse(
-                status_code=308,  # Permanent redirect
-                content={
-                    "redirect": new_path,
-                    "warning": "API path deprecated. Use /api/v1/ prefix instead.",
-                },
-                headers={
-                    "Location": new_path,
-                    "X-API-Deprecation": "true",
-                    "X-API-Version": "v1",
-                },
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": self._headers}
             )
-            return response
-
-        response = await call_next(request)
-        return response
+            body = b"" if scope["method"] == "HEAD" else self._BODY
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
 
 
 class RateLimitHeadersMiddleware(BaseHTTPMiddleware):
@@ -117,15 +161,9 @@ class RateLimitHeadersMiddleware(BaseHTTPMiddleware):
         rate_limit_info = getattr(request.state, "rate_limit_info", None)
 
         if rate_limit_info:
-            response.headers["X-RateLimit-Limit"] = str(
-                rate_limit_info.get("limit", settings.RATE_LIMIT_REQUESTS_PER_MINUTE)
-            )
-            response.headers["X-RateLimit-Remaining"] = str(
-                rate_limit_info.get("remaining", settings.RATE_LIMIT_REQUESTS_PER_MINUTE)
-            )
-            response.headers["X-RateLimit-Reset"] = str(
-                int(rate_limit_info.get("reset_at", time.time() + 60))
-            )
+            response.headers["X-RateLimit-Limit"] = str(rate_limit_info.limit)
+            response.headers["X-RateLimit-Remaining"] = str(rate_limit_info.remaining)
+            response.headers["X-RateLimit-Reset"] = str(int(rate_limit_info.reset_at))
             response.headers["X-RateLimit-Policy"] = (
                 f"{settings.RATE_LIMIT_REQUESTS_PER_MINUTE};w=60;burst={settings.RATE_LIMIT_BURST_SIZE}"
             )
@@ -151,7 +189,7 @@ def create_error_response(
     request_id: Optional[str] = None,
     detail: Optional[str] = None,
     meta: Optional[dict[str, Any]] = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a standardized error response.
 
@@ -163,7 +201,7 @@ def create_error_response(
         meta: Additional metadata to include
 
     Returns:
-        JSONResponse with standardized error format
+        ORJSONResponse with standardized error format
     """
     error_info = ERROR_CODES.get(error_code, ERROR_CODES["INTERNAL_ERROR"])
 
@@ -189,7 +227,7 @@ def create_error_response(
     # Add timestamp
     content["error"]["timestamp"] = utc_now().isoformat()
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code or error_info["status"],
         content=content,
         headers={
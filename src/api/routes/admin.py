@@ -127,17 +127,15 @@ async def queue_stats(request: Request):
     from src.services.security import require_admin_auth
 
     require_admin_auth(request)
-    from src.core.config import settings
-    from src.services.job_queue import QueueConfig, queue_stats as get_stats
+    from src.services.job_queue import queue_config_from_settings, queue_stats as get_stats
 
+    state = request.app.state
     try:
-        cfg = QueueConfig(
-            redis_url=settings.REDIS_URL,
-            queue_name=settings.REDIS_QUEUE_NAME,
-            default_timeout=settings.YT_EXTRACTION_TIMEOUT + 10,
-            result_ttl=settings.REDIS_RESULT_TTL,
+        stats = await anyio.to_thread.run_sync(
+            get_stats,
+            getattr(state, "queue_cfg", None) or queue_config_from_settings(),
+            getattr(state, "queue_redis", None),
         )
-        stats = await anyio.to_thread.run_sync(lambda: get_stats(cfg))
         return {**stats, "timestamp": utc_now_iso_z()}
     except Exception as e:
         logger.error(f"Queue stats error: {e}", exc_info=True)
@@ -3,7 +3,7 @@ Health check endpoints.
 """
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.core.config import settings
 from src.core.time_utils import utc_now_iso_z
@@ -43,8 +43,15 @@ async def health_check(request: Request):
     except Exception:
         postgres_status = "disconnected"
 
+    migration_status = getattr(request.app.state, "migration_status", None)
+    migration_state = (migration_status or {}).get("state", "unknown")
+
     # Overall status
-    healthy = redis_status == "connected" and postgres_status == "connected"
+    healthy = (
+        redis_status == "connected"
+        and postgres_status == "connected"
+        and migration_state != "failed"
+    )
     status_code = 200 if healthy else 503
 
     payload = {
@@ -55,6 +62,7 @@ async def health_check(request: Request):
             "api": "ready",
             "redis": redis_status,
             "postgres": postgres_status,
+            "migrations": migration_state,
         },
     }
 
@@ -70,10 +78,8 @@ async def health_check(request: Request):
     except Exception:
         pass
 
-    response = JSONResponse(status_code=status_code, content=payload)
-    # Health endpoints also get API version header
-    response.headers["X-API-Version"] = settings.API_CURRENT_VERSION
-    return response
+    # X-API-Version is added by the request middleware like every other response.
+    return ORJSONResponse(status_code=status_code, content=payload)
 
 
 @router.get(
@@ -133,9 +133,9 @@ async def _extract_or_enqueue(
             request_path=request.url.path,
             webhook_url=subtitle_req.webhook_url,
         )
-        from fastapi.responses import JSONResponse
+        from fastapi.responses import ORJSONResponse
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=202,
             content=ExtractionQueuedResponse(
                 job_id=job_id,
@@ -330,3 +330,26 @@ async def job_status(
     require_api_key_if_configured(request)
     orchestrator = request.state.subtitle_orchestrator
     return await orchestrator.get_job(job_id=job_id)
+
+
+@router.get(
+    "/job/{job_id}/wait",
+    summary="Wait for job completion",
+    operation_id="wait_for_job",
+    responses={
+        200: {"description": "Job reached a terminal status or the wait timed out"},
+    },
+)
+async def wait_for_job(
+    request: Request,
+    job_id: str,
+    timeout: float = Query(
+        25.0, ge=0, le=25, description="Maximum seconds to hold the request open"
+    ),
+) -> dict[str, Any]:
+    """Long-poll a job: respond when it finishes or fails, or after `timeout` seconds."""
+    from src.services.security import require_api_key_if_configured
+
+    require_api_key_if_configured(request)
+    orchestrator = request.state.subtitle_orchestrator
+    return await orchestrator.wait_for_job(job_id=job_id, timeout=timeout)
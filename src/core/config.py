@@ -16,6 +16,9 @@ from functools import lru_cache
 logger = logging.getLogger(__name__)
 
 
+_MIGRATION_MODES = ("sync", "async", "skip")
+
+
 class Settings(BaseSettings):
     """Application settings from environment variables."""
 
@@ -46,11 +49,15 @@ class Settings(BaseSettings):
     DB_AUTO_CREATE: bool = (
         True  # Create tables automatically (dev/local). Prefer Alembic in production.
     )
+    # Schema init at startup: sync (block until done), async (run in background,
+    # progress reported by /health), skip (schema managed externally via Alembic).
+    MIGRATION_MODE: str = "sync"
 
     # Redis (Queue & Cache)
     REDIS_URL: str = "redis://localhost:6379/2"
     REDIS_QUEUE_NAME: str = "youtube-extraction"
     REDIS_RESULT_TTL: int = 86400  # 24 hours
+    REDIS_MAX_CONNECTIONS: Optional[int] = None  # Async pool cap (None = redis-py default)
 
     # YouTube Extraction Configuration
     YT_EXTRACTION_TIMEOUT: int = 30  # seconds
@@ -174,6 +181,22 @@ class Settings(BaseSettings):
 
         return [str(v)]
 
+    @field_validator("MIGRATION_MODE", mode="before")
+    @classmethod
+    def _parse_migration_mode(cls, v: Any) -> str:
+        """Normalize MIGRATION_MODE; unknown values fall back to sync with a warning."""
+        mode = str(v).strip().lower()
+        if mode not in _MIGRATION_MODES:
+            logger.warning(
+                "invalid_migration_mode",
+                extra={
+                    "message": f"MIGRATION_MODE={v!r} is not one of "
+                              f"{', '.join(_MIGRATION_MODES)}; using 'sync'."
+                },
+            )
+            return "sync"
+        return mode
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Index,
     UniqueConstraint,
     Text,
+    text,
 )
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.dialects.postgresql import UUID, JSONB
@@ -43,6 +44,12 @@ class SubtitleRecord(Base):
         Index("ix_video_id", "video_id"),
         Index("ix_created_at", "created_at"),
         Index("ix_status", "extraction_status"),
+        Index(
+            "ix_subtitles_jsonb_path",
+            "subtitles",
+            postgresql_using="gin",
+            postgresql_ops={"subtitles": "jsonb_path_ops"},
+        ),
         UniqueConstraint("video_id", "language", name="uq_video_language"),
         {"schema": DB_SCHEMA},
     )
@@ -107,9 +114,26 @@ class ExtractionJob(Base):
 
     __tablename__ = "extraction_jobs"
     __table_args__ = (
-        Index("ix_video_id_job", "video_id"),
-        Index("ix_job_status", "job_status"),
+        Index(
+            "ix_job_status_active",
+            "job_status",
+            postgresql_where=text("job_status IN ('queued', 'processing', 'failed')"),
+        ),
         Index("ix_created_at_job", "created_at"),
+        # Serves SubtitleRepository.get_pending_job_id() as an index-only scan;
+        # finished jobs are excluded.
+        Index(
+            "ix_pending_jobs_covering",
+            "video_id",
+            "language",
+            postgresql_where=text("job_status IN ('queued', 'processing')"),
+            postgresql_include=["job_id", "attempt", "created_at"],
+        ),
+        Index(
+            "ix_webhook_delivery_status_active",
+            "webhook_delivery_status",
+            postgresql_where=text("webhook_delivery_status IN ('pending', 'failed')"),
+        ),
         {"schema": DB_SCHEMA},
     )
 
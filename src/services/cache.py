@@ -17,15 +17,25 @@ logger = logging.getLogger(__name__)
 class CacheManager:
     """Manages distributed caching using Redis."""
 
-    def __init__(self, redis_url: str):
-        """Initialize cache manager."""
+    def __init__(self, redis_url: str, max_connections: Optional[int] = None):
+        """Initialize cache manager.
+
+        The client created on connect() owns the process's async connection
+        pool; other async Redis users (e.g. RateLimiter) should reuse
+        ``self.redis`` rather than opening their own.
+        """
         self.redis_url = redis_url
+        self.max_connections = max_connections
         self.redis: Optional[Redis] = None
 
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.redis = await redis.from_url(self.redis_url, decode_responses=True)
+            self.redis = await redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                max_connections=self.max_connections,
+            )
             await self.redis.ping()
             logger.info("Connected to Redis cache")
         except Exception as e:
@@ -18,6 +18,8 @@ from src.models.subtitle import Base
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_INIT_LOCK_NAME = "subs_migration"
+
 
 class DatabaseManager:
     """Manages database connections and operations."""
@@ -84,9 +86,17 @@ class DatabaseManager:
             logger.info("Database connection closed")
 
     async def init_schema(self, *, create_tables: bool) -> None:
-        """Ensure schema exists and optionally create tables (dev/local)."""
+        """Ensure schema exists and optionally create tables (dev/local).
+
+        Serialized across processes with a transaction-scoped advisory lock so
+        concurrent API workers starting together don't race on DDL.
+        """
         try:
             async with self.engine.begin() as conn:
+                await conn.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext(:name))"),
+                    {"name": SCHEMA_INIT_LOCK_NAME},
+                )
                 await conn.execute(
                     text(f"CREATE SCHEMA IF NOT EXISTS {self.db_schema}")
                 )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
 import redis
 from rq import Queue
 from rq.job import Job
 
+from src.core.config import settings
+
 
 @dataclass(frozen=True)
 class QueueConfig:
@@ -16,13 +19,25 @@ class QueueConfig:
     result_ttl: int
 
 
+def queue_config_from_settings() -> QueueConfig:
+    return QueueConfig(
+        redis_url=settings.REDIS_URL,
+        queue_name=settings.REDIS_QUEUE_NAME,
+        default_timeout=settings.YT_EXTRACTION_TIMEOUT + 10,
+        result_ttl=settings.REDIS_RESULT_TTL,
+    )
+
+
+@lru_cache(maxsize=None)
 def get_redis_connection(redis_url: str) -> redis.Redis:
     # RQ stores pickled job payloads in Redis; keep raw bytes for correctness.
+    # One client (and connection pool) per URL, shared by every enqueue/fetch/
+    # stats call; redis.Redis is thread-safe, so anyio worker threads can share it.
     return redis.Redis.from_url(redis_url)
 
 
-def get_queue(cfg: QueueConfig) -> Queue:
-    conn = get_redis_connection(cfg.redis_url)
+def get_queue(cfg: QueueConfig, connection: Optional[redis.Redis] = None) -> Queue:
+    conn = connection or get_redis_connection(cfg.redis_url)
     return Queue(
         name=cfg.queue_name, connection=conn, default_timeout=cfg.default_timeout
     )
@@ -55,8 +70,12 @@ def fetch_job(cfg: QueueConfig, job_id: str) -> Optional[Job]:
         return None
 
 
-def queue_stats(cfg: QueueConfig) -> dict[str, Any]:
-    q = get_queue(cfg)
+def queue_stats(
+    cfg: QueueConfig, connection: Optional[redis.Redis] = None
+) -> dict[str, Any]:
+    # Pass a long-lived `connection` on hot paths (e.g. /metrics scrapes) to
+    # avoid opening a new Redis connection per call.
+    q = get_queue(cfg, connection)
 
     def _count(reg) -> int:
         c = getattr(reg, "count", 0)
@@ -13,6 +13,9 @@ from src.services.in_memory_cache import InMemoryCache
 from src.services.job_queue import QueueConfig, enqueue_job, fetch_job
 from src.services.subtitle_repository import SubtitleRepository
 
+# RQ statuses after which a job will not change again
+TERMINAL_JOB_STATUSES = frozenset({"finished", "failed", "stopped", "canceled", "not_found"})
+
 
 class SubtitleOrchestrator:
     def __init__(
@@ -163,16 +166,16 @@ class SubtitleOrchestrator:
 
         async with self.db_manager.get_session() as session:
             repo = SubtitleRepository(session)
-            existing = await repo.get_pending_job(video_id, language)
-            if existing:
+            existing_job_id = await repo.get_pending_job_id(video_id, language)
+            if existing_job_id:
                 # Avoid returning stale jobs (e.g. Redis flushed/restarted).
                 rq_job = await anyio.to_thread.run_sync(
-                    lambda: fetch_job(self.queue_cfg, existing.job_id)
+                    fetch_job, self.queue_cfg, existing_job_id
                 )
                 if rq_job is not None:
-                    return existing.job_id
+                    return existing_job_id
                 await repo.update_job_status(
-                    job_id=existing.job_id,
+                    job_id=existing_job_id,
                     status="stale",
                     error_message="rq_job_missing",
                 )
@@ -204,7 +207,7 @@ class SubtitleOrchestrator:
         return job_id
 
     async def get_job(self, *, job_id: str) -> dict[str, Any]:
-        job = await anyio.to_thread.run_sync(lambda: fetch_job(self.queue_cfg, job_id))
+        job = await anyio.to_thread.run_sync(fetch_job, self.queue_cfg, job_id)
         if not job:
             return {"job_id": job_id, "status": "not_found"}
 
@@ -220,3 +223,20 @@ class SubtitleOrchestrator:
             "result": result,
             "exc_info": job.exc_info if job.is_failed else None,
         }
+
+    async def wait_for_job(
+        self, *, job_id: str, timeout: float, interval: float = 0.5
+    ) -> dict[str, Any]:
+        """Return the job once it reaches a terminal status or `timeout` passes.
+
+        Polling Redis here replaces one HTTP round-trip per poll from the
+        client with a single long-poll request.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            job = await self.get_job(job_id=job_id)
+            remaining = deadline - loop.time()
+            if job["status"] in TERMINAL_JOB_STATUSES or remaining <= 0:
+                return job
+            await asyncio.sleep(min(interval, remaining))
@@ -92,11 +92,10 @@ class SubtitleRepository:
             self.session.add(rec)
         await self.session.commit()
 
-    async def get_pending_job(
-        self, video_id: str, language: str
-    ) -> Optional[ExtractionJob]:
+    async def get_pending_job_id(self, video_id: str, language: str) -> Optional[str]:
+        """Get the newest pending job's ID (index-only scan on ix_pending_jobs_covering)."""
         q = (
-            select(ExtractionJob)
+            select(ExtractionJob.job_id)
             .where(
                 ExtractionJob.video_id == video_id,
                 ExtractionJob.language == language,
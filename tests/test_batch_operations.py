@@ -350,6 +350,42 @@ class TestBatchStatusQueries:
             assert data.get("status") in valid_states
 
 
+class TestJobWait:
+    """Tests for the long-poll job wait."""
+
+    @staticmethod
+    def _orchestrator():
+        from src.services.subtitle_orchestrator import SubtitleOrchestrator
+
+        return SubtitleOrchestrator(
+            memory_cache=Mock(), cache_manager=Mock(), db_manager=Mock(), queue_cfg=Mock()
+        )
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_when_job_finishes(self):
+        """The wait returns as soon as the job reaches a terminal status."""
+        orchestrator = self._orchestrator()
+        statuses = iter(["queued", "started", "finished"])
+        orchestrator.get_job = AsyncMock(
+            side_effect=lambda job_id: {"job_id": job_id, "status": next(statuses)}
+        )
+
+        job = await orchestrator.wait_for_job(job_id="j1", timeout=5, interval=0.01)
+
+        assert job["status"] == "finished"
+        assert orchestrator.get_job.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_with_current_status(self):
+        """A job that never finishes is returned as-is once the timeout passes."""
+        orchestrator = self._orchestrator()
+        orchestrator.get_job = AsyncMock(return_value={"job_id": "j1", "status": "started"})
+
+        job = await orchestrator.wait_for_job(job_id="j1", timeout=0.05, interval=0.01)
+
+        assert job["status"] == "started"
+
+
 class TestBatchErrorHandling:
     """Tests for error handling in batch operations."""
 
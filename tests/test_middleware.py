@@ -685,3 +685,31 @@ class TestExposedHeaders:
                 # At minimum, X-Request-ID and X-API-Version should always be present
                 assert "X-Request-ID" in headers
                 assert "X-API-Version" in headers
+
+
+class TestLivenessProbeMiddleware:
+    """Tests for the /live ASGI fast path."""
+
+    @pytest.mark.asyncio
+    async def test_live_served_without_lifespan(self):
+        """Test that /live answers before any service-backed middleware runs."""
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/live")
+
+            assert response.status_code == 200
+            assert response.json() == {"status": "ok"}
+            assert "X-API-Version" in response.headers
+
+    @pytest.mark.asyncio
+    async def test_live_post_falls_through_to_router(self):
+        """Test that non-GET methods on /live are not short-circuited."""
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            response = await client.post("/live")
+
+            assert response.status_code == 405
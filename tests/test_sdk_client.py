@@ -0,0 +1,298 @@
+"""
+Tests for the Python SDK clients' request handling.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+_SDK_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+if _SDK_ROOT not in sys.path:
+    sys.path.insert(0, _SDK_ROOT)
+
+import youtube_subtitle_api as sdk  # noqa: E402
+from youtube_subtitle_api import YouTubeSubtitleAPI, YouTubeSubtitleAPIError  # noqa: E402
+
+VIDEO_ID = "dQw4w9WgXcQ"
+SUBTITLE = {
+    "video_id": VIDEO_ID,
+    "language": "en",
+    "subtitles": [{"text": "hello", "start": 0.0, "duration": 1.0}],
+    "plain_text": "hello",
+}
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip retry backoff delays."""
+    monkeypatch.setattr(sdk.time, "sleep", lambda seconds: None)
+
+
+def _client(handler) -> YouTubeSubtitleAPI:
+    client = YouTubeSubtitleAPI(base_url="http://api.test")
+    client._client = httpx.Client(
+        base_url="http://api.test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class TestRequestRetries:
+    """Tests for GET retries in the sync client."""
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_get_retries_gateway_errors(self, stream):
+        """Test that buffered and streamed GETs retry a 503 the same way."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(503, json={"error": {"code": "UNAVAILABLE"}})
+            return httpx.Response(200, json=SUBTITLE)
+
+        subtitle = _client(handler).get_subtitles(VIDEO_ID, stream=stream)
+
+        assert subtitle.plain_text == "hello"
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_get_gives_up_after_max_retries(self, stream):
+        """Test that retries stop at config.max_retries."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(503, json={"error": {"code": "UNAVAILABLE"}})
+
+        with pytest.raises(YouTubeSubtitleAPIError):
+            _client(handler).get_subtitles(VIDEO_ID, stream=stream)
+        assert len(calls) == 4
+
+    def test_connect_errors_are_left_to_the_transport(self):
+        """Test that _request does not retry on top of transport retries."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(httpx.ConnectError):
+            _client(handler).get_subtitles(VIDEO_ID)
+        assert len(calls) == 1
+
+    def test_read_errors_are_retried(self):
+        """Test that a dropped connection mid-request is retried."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                raise httpx.ReadError("reset", request=request)
+            return httpx.Response(200, json=SUBTITLE)
+
+        assert _client(handler).get_subtitles(VIDEO_ID).plain_text == "hello"
+        assert len(calls) == 2
+
+
+def _async_client(handler) -> sdk.AsyncYouTubeSubtitleAPI:
+    client = sdk.AsyncYouTubeSubtitleAPI(base_url="http://api.test")
+    client._client = httpx.AsyncClient(
+        base_url="http://api.test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class TestBatchHelperRetries:
+    """Tests for retries in AsyncYouTubeSubtitleAPI.iter_extract_subtitles_batch."""
+
+    @pytest.fixture(autouse=True)
+    def no_async_sleep(self, monkeypatch):
+        """Skip back-off delays in the batch helpers."""
+        async def sleep(seconds):
+            return None
+
+        monkeypatch.setattr(sdk.asyncio, "sleep", sleep)
+
+    async def test_cached_fetch_retries_in_one_layer(self):
+        """Test that a failing cached fetch makes max_retries + 1 attempts."""
+        fetches = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/subtitles/batch":
+                return httpx.Response(
+                    202,
+                    json={
+                        "status": "queued",
+                        "video_count": 1,
+                        "queued_count": 0,
+                        "cached_count": 1,
+                        "job_ids": [],
+                        "cached": [VIDEO_ID],
+                    },
+                )
+            fetches.append(request.url.path)
+            return httpx.Response(503, json={"error": {"code": "UNAVAILABLE"}})
+
+        client = _async_client(handler)
+        results = await client.extract_subtitles_batch_parallel([VIDEO_ID], max_retries=2)
+
+        assert isinstance(results[0][1], YouTubeSubtitleAPIError)
+        assert len(fetches) == 3
+
+
+class TestWaitForJob:
+    """Tests for wait_for_job long-polling."""
+
+    @pytest.mark.parametrize("status", ["finished", "unknown"])
+    def test_paces_immediate_answers_without_result(self, monkeypatch, status):
+        """Test that /wait answers without a result are not re-requested in a busy loop."""
+        sleeps = []
+        monkeypatch.setattr(sdk.time, "sleep", sleeps.append)
+        polls = []
+
+        def handler(request):
+            polls.append(request.url.path)
+            if len(polls) < 3:
+                return httpx.Response(200, json={"job_id": "job-1", "status": status})
+            return httpx.Response(
+                200, json={"job_id": "job-1", "status": "finished", "result": SUBTITLE}
+            )
+
+        subtitle = _client(handler).wait_for_job("job-1", timeout=30)
+
+        assert subtitle.plain_text == "hello"
+        assert all(path.endswith("/wait") for path in polls)
+        assert len(sleeps) == 2
+        assert all(delay > 0 for delay in sleeps)
+
+    def test_does_not_sleep_after_pending_long_poll(self, monkeypatch):
+        """Test that a pending answer is followed straight by the next long-poll."""
+        sleeps = []
+        monkeypatch.setattr(sdk.time, "sleep", sleeps.append)
+        polls = []
+
+        def handler(request):
+            polls.append(request.url.path)
+            if len(polls) == 1:
+                return httpx.Response(200, json={"job_id": "job-1", "status": "started"})
+            return httpx.Response(
+                200, json={"job_id": "job-1", "status": "finished", "result": SUBTITLE}
+            )
+
+        assert _client(handler).wait_for_job("job-1", timeout=30).plain_text == "hello"
+        assert sleeps == []
+
+    def test_long_poll_retries_with_remaining_time(self, monkeypatch):
+        """Test that a failed long-poll is re-sent with a fresh server wait."""
+        clock = [0.0]
+        monkeypatch.setattr(sdk.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(sdk.time, "sleep", lambda seconds: None)
+        waits = []
+
+        def handler(request):
+            waits.append(float(request.url.params["timeout"]))
+            if len(waits) == 1:
+                clock[0] += 20.0
+                return httpx.Response(503, json={"error": {"code": "UNAVAILABLE"}})
+            return httpx.Response(
+                200, json={"job_id": "job-1", "status": "finished", "result": SUBTITLE}
+            )
+
+        assert _client(handler).wait_for_job("job-1", timeout=30).plain_text == "hello"
+        assert waits == [25.0, 10.0]
+
+    def test_long_poll_does_not_retry_past_deadline(self):
+        """Test that a retry_after beyond the deadline raises instead of sleeping."""
+        polls = []
+
+        def handler(request):
+            polls.append(request.url.path)
+            return httpx.Response(
+                429,
+                json={"error": {"code": "RATE_LIMITED", "meta": {"retry_after": 120}}},
+            )
+
+        with pytest.raises(sdk.RateLimitError):
+            _client(handler).wait_for_job("job-1", timeout=30)
+        assert len(polls) == 1
+
+    async def test_async_paces_finished_without_result(self, monkeypatch):
+        """Test the async client paces a finished job whose result isn't stored yet."""
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(sdk.asyncio, "sleep", sleep)
+        polls = []
+
+        def handler(request):
+            polls.append(request.url.path)
+            if len(polls) < 3:
+                return httpx.Response(200, json={"job_id": "job-1", "status": "finished"})
+            return httpx.Response(
+                200, json={"job_id": "job-1", "status": "finished", "result": SUBTITLE}
+            )
+
+        subtitle = await _async_client(handler).wait_for_job("job-1", timeout=30)
+
+        assert subtitle.plain_text == "hello"
+        assert len(sleeps) == 2
+
+
+class TestBatchHelperResults:
+    """Tests for results reported by iter_extract_subtitles_batch."""
+
+    async def test_malformed_batch_response_reports_every_video(self):
+        """Test that an unexpected batch response fails its videos instead of hanging."""
+        def handler(request):
+            return httpx.Response(
+                202,
+                json={
+                    "status": "queued",
+                    "video_count": 1,
+                    "queued_count": 1,
+                    "cached_count": 0,
+                    "job_ids": 7,
+                    "cached": [],
+                },
+            )
+
+        client = _async_client(handler)
+        results = await asyncio.wait_for(
+            client.extract_subtitles_batch_parallel([VIDEO_ID]), timeout=5
+        )
+
+        assert isinstance(results[0][1], TypeError)
+
+    async def test_cached_fetch_uses_get_subtitles_cache_key(self):
+        """Test that server-cached results are not stored as extraction results."""
+        def handler(request):
+            if request.url.path == "/api/v1/subtitles/batch":
+                return httpx.Response(
+                    202,
+                    json={
+                        "status": "queued",
+                        "video_count": 1,
+                        "queued_count": 0,
+                        "cached_count": 1,
+                        "job_ids": [],
+                        "cached": [VIDEO_ID],
+                    },
+                )
+            return httpx.Response(200, json=SUBTITLE)
+
+        client = sdk.AsyncYouTubeSubtitleAPI(base_url="http://api.test", cache=True)
+        client._client = httpx.AsyncClient(
+            base_url="http://api.test", transport=httpx.MockTransport(handler)
+        )
+        results = await client.extract_subtitles_batch_parallel(
+            [VIDEO_ID], clean_for_ai=False
+        )
+
+        assert results[0][1].plain_text == "hello"
+        assert client._cache.get(("subtitles", VIDEO_ID, "en")) is results[0][1]
+        assert client._cache.get((VIDEO_ID, "en", False)) is None
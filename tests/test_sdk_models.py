@@ -0,0 +1,139 @@
+"""
+Tests for the Python SDK's subtitle models.
+"""
+
+import copy
+import os
+import sys
+
+_SDK_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+if _SDK_ROOT not in sys.path:
+    sys.path.insert(0, _SDK_ROOT)
+
+from youtube_subtitle_api.models import Subtitle, SubtitleItem  # noqa: E402
+
+
+def _subtitle() -> Subtitle:
+    return Subtitle(
+        video_id="dQw4w9WgXcQ",
+        language="en",
+        subtitles=[
+            SubtitleItem("hello world", 0.0, 1.0),
+            SubtitleItem("foo bar", 1.0, 2.0),
+            SubtitleItem("goodbye", 2.0, 3.0),
+        ],
+    )
+
+
+class TestSubtitleSearch:
+    """Tests for Subtitle.search_text and search_texts."""
+
+    def test_search_text_finds_matching_items(self):
+        """Test that each matching item is reported once, in order."""
+        subtitle = _subtitle()
+        assert subtitle.search_text("o") == subtitle.subtitles
+        assert subtitle.search_text("FOO") == [subtitle.subtitles[1]]
+        assert subtitle.search_text("FOO", case_sensitive=True) == []
+
+    def test_search_text_sees_in_place_replacement(self):
+        """Test that replacing an item in place invalidates the search index."""
+        subtitle = _subtitle()
+        assert subtitle.search_text("foo") == [subtitle.subtitles[1]]
+
+        subtitle.subtitles[1] = SubtitleItem("baz qux quux", 1.0, 2.0)
+
+        assert subtitle.search_text("foo") == []
+        assert subtitle.search_text("baz") == [subtitle.subtitles[1]]
+        assert subtitle.search_texts(["baz", "foo"]) == {
+            "baz": [subtitle.subtitles[1]],
+            "foo": [],
+        }
+
+    def test_search_text_sees_replaced_list(self):
+        """Test that assigning a new list of the same length is picked up."""
+        subtitle = _subtitle()
+        assert subtitle.search_text("hello") == [subtitle.subtitles[0]]
+
+        subtitle.subtitles = [SubtitleItem(f"line {i}", i, i + 1) for i in range(3)]
+
+        assert subtitle.search_text("hello") == []
+        assert subtitle.search_text("line 2") == [subtitle.subtitles[2]]
+
+
+class TestSubtitleTimeRange:
+    """Tests for Subtitle.get_text_by_time_range."""
+
+    def test_time_range_on_ordered_items(self):
+        """Test range lookup with and without an end bound."""
+        subtitle = _subtitle()
+        assert subtitle.get_text_by_time_range(1.0, 2.0) == subtitle.subtitles[1:]
+        assert subtitle.get_text_by_time_range(1.5) == subtitle.subtitles[2:]
+
+    def test_time_range_sees_in_place_replacement(self):
+        """Test that moving an item's start time invalidates the start index."""
+        subtitle = _subtitle()
+        assert subtitle.get_text_by_time_range(4, 7) == []
+
+        subtitle.subtitles[0] = SubtitleItem("moved", 5.0, 6.0)
+
+        assert subtitle.get_text_by_time_range(4, 7) == [subtitle.subtitles[0]]
+
+    def test_time_range_on_unordered_items(self):
+        """Test that out-of-order items fall back to a full scan."""
+        subtitle = _subtitle()
+        subtitle.subtitles.append(SubtitleItem("early", 0.5, 0.8))
+        assert subtitle.get_text_by_time_range(0.2, 1.0) == [
+            subtitle.subtitles[1],
+            subtitle.subtitles[3],
+        ]
+
+
+class TestSubtitleWordCount:
+    """Tests for Subtitle.word_count."""
+
+    def test_word_count_prefers_plain_text(self):
+        """Test that plain_text is counted when present."""
+        subtitle = _subtitle()
+        subtitle.plain_text = "one two three"
+        assert subtitle.word_count == 3
+
+    def test_word_count_sees_in_place_replacement(self):
+        """Test that replacing an item in place is reflected in the count."""
+        subtitle = _subtitle()
+        assert subtitle.word_count == 5
+
+        subtitle.subtitles[2] = SubtitleItem("see you later", 2.0, 3.0)
+
+        assert subtitle.word_count == 7
+
+    def test_word_count_switches_source(self):
+        """Test that clearing plain_text falls back to the items."""
+        subtitle = _subtitle()
+        subtitle.plain_text = "one"
+        assert subtitle.word_count == 1
+        subtitle.plain_text = None
+        assert subtitle.word_count == 5
+
+
+class TestSubtitleCaches:
+    """Tests for the lazily built lookup caches on Subtitle."""
+
+    def test_caches_do_not_affect_equality(self):
+        """Test that a warmed instance still equals a fresh one."""
+        warmed = _subtitle()
+        warmed.search_text("foo")
+        warmed.get_text_by_time_range(1.0)
+        assert warmed.word_count == 5
+        assert warmed == _subtitle()
+
+    def test_copy_shares_valid_caches(self):
+        """Test that a shallow copy rechecks caches against its own items."""
+        original = _subtitle()
+        assert original.search_text("foo") == [original.subtitles[1]]
+
+        clone = copy.copy(original)
+        clone.subtitles = list(clone.subtitles)
+        clone.subtitles[1] = SubtitleItem("baz", 1.0, 2.0)
+
+        assert clone.search_text("foo") == []
+        assert original.search_text("foo") == [original.subtitles[1]]